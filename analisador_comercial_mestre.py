@@ -8,6 +8,7 @@ Transforma transcrições de reuniões em insights estratégicos acionáveis.
 """
 
 import json
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +18,12 @@ import warnings
 warnings.filterwarnings('ignore')
 
 
+def listar_transcricoes(pasta: Path) -> List[Path]:
+    """Lista os arquivos .txt da pasta em uma única passada com os.scandir."""
+    with os.scandir(pasta) as it:
+        return [Path(entry.path) for entry in it if entry.name.endswith(".txt") and entry.is_file()]
+
+
 class AnalisadorComercialMestre:
     def __init__(self, workspace_path: str = None):
         """
@@ -683,12 +690,17 @@ Atenciosamente,
             for acao in proximos.get('Acoes_Imediatas', []):
                 f.write(f"• {acao}\n")
 
-    def processar_todas_reunioes(self) -> Dict[str, Any]:
-        """Processa todas as transcrições disponíveis."""
+    def processar_todas_reunioes(self, arquivos: List[Path] = None) -> Dict[str, Any]:
+        """
+        Processa todas as transcrições disponíveis.
+        
+        Args:
+            arquivos: Transcrições já listadas pelo chamador (evita nova varredura da pasta)
+        """
         print("🚀 Iniciando processamento de todas as reuniões...")
         
         resultados = {}
-        arquivos_txt = list(self.reunioes_path.glob("*.txt"))
+        arquivos_txt = arquivos if arquivos is not None else listar_transcricoes(self.reunioes_path)
         
         if not arquivos_txt:
             print("❌ Nenhum arquivo de transcrição encontrado!")
@@ -3,15 +3,140 @@ Analisador Estratégico de Reuniões de Vendas - VERSÃO LOCAL
 Sistema que funciona SEM chave da OpenAI - análise baseada em padrões e regras
 """
 
+import csv
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from itertools import product, repeat
+
+# ==========================================
+# TABELA DE SUGESTÕES DO PLANO DE AÇÃO
+# ==========================================
+# Faixas de score: [0, 0.4) baixa, [0.4, 0.7) média, >= 0.7 alta
+_LIMITES_FAIXA = [float("-inf"), 0.4, 0.7, float("inf")]
+_ROTULOS_FAIXA = ["baixa", "media", "alta"]
+
+# Cada modelo é (ação, offset do prazo em dias, formato do prazo, prioridade, tipo)
+_SUGESTOES_URGENCIA = {
+    "alta": [
+        ("Ligação imediata para {cliente} - Lead com alta urgência", 0, "{dias} dia(s)", "ALTA", "Contato direto"),
+        ("Envio de proposta comercial para {cliente}", 1, "{dias} dia(s)", "ALTA", "Proposta"),
+    ],
+    "media": [
+        ("Email de follow-up para {cliente}", 0, "{dias} dia(s)", "MÉDIA", "Follow-up"),
+    ],
+    "baixa": [],
+}
+
+_SUGESTOES_NECESSIDADE = {
+    "alta": [
+        ("Agendar reunião de descoberta com {cliente}", 2, "{dias} dias", "ALTA", "Reunião"),
+        ("Enviar case de sucesso relevante para {cliente}", 1, "{dias} dia(s)", "MÉDIA", "Conteúdo"),
+    ],
+    "media": [],
+    "baixa": [],
+}
+
+_SUGESTOES_FIT = {
+    "alta": [
+        ("Preparar demonstração personalizada para {cliente}", 3, "{dias} dias", "ALTA", "Demonstração"),
+    ],
+    "media": [
+        ("Agendar call de qualificação técnica com {cliente}", 5, "{dias} dias", "MÉDIA", "Qualificação"),
+    ],
+    "baixa": [],
+}
+
+_SUGESTOES_TEMPERATURA = {
+    "Hot": [
+        ("Preparar contrato e fechar negócio com {cliente}", 0, "{dias} dia(s)", "CRÍTICA", "Fechamento"),
+    ],
+    "Warm": [
+        ("Nurturing campaign para {cliente}", 7, "{dias} dias", "MÉDIA", "Nurturing"),
+    ],
+    "Cold": [
+        ("Educação e awareness para {cliente}", 14, "{dias} dias", "BAIXA", "Educação"),
+    ],
+}
+
+_SUGESTOES_CRITICO = [
+    ("Envolver gestor sênior no deal {cliente}", 0, "{dias} dia(s)", "ALTA", "Gestão"),
+]
+
+# Todas as combinações possíveis são resolvidas na importação do módulo
+_CHAVES_SUGESTOES = ("urgencia_faixa", "necessidade_faixa", "fit_faixa", "temperatura_chave", "critico")
+_TABELA_SUGESTOES = {
+    (urg, nec, fit, temp, critico): tuple((
+        _SUGESTOES_URGENCIA[urg]
+        + _SUGESTOES_NECESSIDADE[nec]
+        + _SUGESTOES_FIT[fit]
+        + _SUGESTOES_TEMPERATURA[temp]
+        + (_SUGESTOES_CRITICO if critico else [])
+    )[:5])  # Máximo 5 sugestões por lead
+    for urg, nec, fit, temp, critico in product(
+        _ROTULOS_FAIXA, _ROTULOS_FAIXA, _ROTULOS_FAIXA, _SUGESTOES_TEMPERATURA, (False, True)
+    )
+}
+_TABELA_SUGESTOES_DF = pd.DataFrame(
+    [(*chave, modelos) for chave, modelos in _TABELA_SUGESTOES.items()],
+    columns=[*_CHAVES_SUGESTOES, "modelos"]
+)
+
+_CAMPOS_CSV_OVERVIEW = [
+    'cliente', 'urgencia', 'necessidade', 'fit', 'confianca', 'temperature', 'prioridade'
+]
+
+_CAMPOS_CSV_PLANO = [
+    'Cliente', 'Categoria', 'Prioridade', 'Temperatura',
+    'Ação', 'Prazo', 'Prioridade_Ação', 'Tipo'
+]
+
+def _analisar_arquivo(analisador, arquivo):
+    """Analisa uma transcrição em um processo do pool, retornando (análise, erro)"""
+    try:
+        return analisador.analisar_transcricao(arquivo), None
+    except Exception as e:
+        return None, str(e)
 
 class AnalisadorReunioesLocal:
+    # Padrões compilados uma única vez, na definição da classe
+    PADROES_CARGOS = [
+        re.compile(padrao, re.IGNORECASE) for padrao in (
+            r'(?:Sr\.|Sra\.|Dr\.|Dra\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:diretor|gerente|presidente|ceo|cto|cfo|coo)',
+            r'(?:diretor|gerente|presidente|ceo|cto|cfo|coo)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:da|do|de)\s+([A-Z][a-z]+)',
+        )
+    ]
+    
+    PADROES_OBJECAO = [
+        re.compile(padrao, re.IGNORECASE) for padrao in (
+            r'(?:mas|porém|contudo|entretanto)\s+([^.!?]+)',
+            r'(?:não|nunca|jamais)\s+(?:posso|consigo|tenho|vou|posso)\s+([^.!?]+)',
+            r'(?:muito\s+)?(?:caro|difícil|complicado)\s+([^.!?]+)',
+            r'(?:problema|risco|preocupação|dúvida)\s+([^.!?]+)',
+        )
+    ]
+    
+    PADROES_PROXIMOS_PASSOS = [
+        re.compile(padrao, re.IGNORECASE) for padrao in (
+            r'(?:próximo|próxima)\s+(?:passo|etapa|fase|reunião)\s*:?\s*([^.!?]+)',
+            r'(?:vamos|vou|iremos)\s+([^.!?]+)',
+            r'(?:agendar|marcar|programar)\s+([^.!?]+)',
+            r'(?:enviar|mandar)\s+([^.!?]+)',
+            r'(?:analisar|estudar|avaliar)\s+([^.!?]+)',
+        )
+    ]
+    
+    PADRAO_TIMELINE = re.compile(r'\b(?:quando|prazo|data|mês|semana)\b', re.IGNORECASE)
+    
     def __init__(self):
         """Inicializa o analisador local sem dependência da OpenAI"""
         self.base_dir = Path("Reunioes em TXT")
@@ -80,16 +205,8 @@ class AnalisadorReunioesLocal:
         """Extrai stakeholders mencionados no texto"""
         stakeholders = []
         
-        # Padrões para identificar pessoas e cargos
-        padroes_cargos = [
-            r'(?:Sr\.|Sra\.|Dr\.|Dra\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:diretor|gerente|presidente|ceo|cto|cfo|coo)',
-            r'(?:diretor|gerente|presidente|ceo|cto|cfo|coo)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:da|do|de)\s+([A-Z][a-z]+)',
-        ]
-        
-        for padrao in padroes_cargos:
-            matches = re.findall(padrao, texto, re.IGNORECASE)
+        for padrao in self.PADROES_CARGOS:
+            matches = padrao.findall(texto)
             for match in matches:
                 if isinstance(match, tuple):
                     nome = ' '.join(match)
@@ -170,16 +287,8 @@ class AnalisadorReunioesLocal:
         """Extrai objeções mencionadas no texto"""
         objeções = []
         
-        # Padrões de objeção
-        padroes_objeção = [
-            r'(?:mas|porém|contudo|entretanto)\s+([^.!?]+)',
-            r'(?:não|nunca|jamais)\s+(?:posso|consigo|tenho|vou|posso)\s+([^.!?]+)',
-            r'(?:muito\s+)?(?:caro|difícil|complicado)\s+([^.!?]+)',
-            r'(?:problema|risco|preocupação|dúvida)\s+([^.!?]+)',
-        ]
-        
-        for padrao in padroes_objeção:
-            matches = re.findall(padrao, texto, re.IGNORECASE)
+        for padrao in self.PADROES_OBJECAO:
+            matches = padrao.findall(texto)
             for match in matches:
                 if len(match.strip()) > 10:  # Pelo menos 10 caracteres
                     objeções.append(match.strip())
@@ -190,17 +299,8 @@ class AnalisadorReunioesLocal:
         """Extrai próximos passos mencionados no texto"""
         proximos_passos = []
         
-        # Padrões de próximos passos
-        padroes_proximos = [
-            r'(?:próximo|próxima)\s+(?:passo|etapa|fase|reunião)\s*:?\s*([^.!?]+)',
-            r'(?:vamos|vou|iremos)\s+([^.!?]+)',
-            r'(?:agendar|marcar|programar)\s+([^.!?]+)',
-            r'(?:enviar|mandar)\s+([^.!?]+)',
-            r'(?:analisar|estudar|avaliar)\s+([^.!?]+)',
-        ]
-        
-        for padrao in padroes_proximos:
-            matches = re.findall(padrao, texto, re.IGNORECASE)
+        for padrao in self.PADROES_PROXIMOS_PASSOS:
+            matches = padrao.findall(texto)
             for match in matches:
                 if len(match.strip()) > 5:  # Pelo menos 5 caracteres
                     proximos_passos.append({
@@ -220,7 +320,7 @@ class AnalisadorReunioesLocal:
             "budget": "Identificado" if palavras_encontradas["orcamento_palavras"] else "Não identificado",
             "authority": "Identificado" if palavras_encontradas["decisao_palavras"] else "Não identificado",
             "need": "Identificado" if palavras_encontradas["necessidade_palavras"] else "Não identificado",
-            "timeline": "Identificado" if re.search(r'\b(?:quando|prazo|data|mês|semana)\b', texto, re.IGNORECASE) else "Não identificado"
+            "timeline": "Identificado" if self.PADRAO_TIMELINE.search(texto) else "Não identificado"
         }
         
         # MEDDIC
@@ -453,11 +553,17 @@ Atenciosamente,
         
         todas_analises = []
         
-        for arquivo in arquivos_txt:
+        # Cada transcrição é independente: a análise roda em paralelo entre processos
+        max_workers = min(os.cpu_count() or 1, len(arquivos_txt))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            resultados = list(executor.map(_analisar_arquivo, repeat(self), arquivos_txt, chunksize=4))
+        
+        for arquivo, (analise, erro) in zip(arquivos_txt, resultados):
             nome_cliente = arquivo.stem  # Nome sem extensão
             
             try:
-                analise = self.analisar_transcricao(arquivo)
+                if erro:
+                    raise RuntimeError(erro)
                 if analise:
                     analise["cliente"] = nome_cliente
                     analise["data_analise"] = datetime.now().strftime("%Y-%m-%d")
@@ -503,8 +609,10 @@ Atenciosamente,
         )
         
         # Salva também em CSV para Excel
-        df = pd.DataFrame(overview)
-        df.to_csv(self.output_dir / "overview_geral.csv", index=False, encoding="utf-8")
+        with open(self.output_dir / "overview_geral.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=_CAMPOS_CSV_OVERVIEW, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(overview)
         
         print(f"✓ Overview salvo em: {self.output_dir / 'overview_geral.json'}")
     
@@ -581,8 +689,20 @@ Atenciosamente,
         """Gera um plano de ação concreto com datas e sugestões específicas"""
         print("\n🎯 Gerando Plano de Ação Estratégico...")
         
-        # Ordena por prioridade
-        analises_ordenadas = sorted(analises, key=lambda x: x.get("scores", {}).get("prioridade", 0), reverse=True)
+        # Ordena por prioridade (média de urgência, necessidade e fit)
+        prioridades = np.fromiter(
+            (
+                (a.get("scores", {}).get("urgencia", 0)
+                 + a.get("scores", {}).get("necessidade", 0)
+                 + a.get("scores", {}).get("fit", 0)) / 3
+                for a in analises
+            ),
+            dtype=np.float64,
+            count=len(analises)
+        )
+        ordem = np.argsort(-prioridades, kind="stable")
+        analises_ordenadas = [analises[i] for i in ordem]
+        prioridades_ordenadas = prioridades[ordem]
         
         plano_acao = {
             "data_geracao": datetime.now().strftime("%Y-%m-%d %H:%M"),
@@ -596,15 +716,11 @@ Atenciosamente,
         }
         
         # Analisa cada lead e gera sugestões específicas
-        for i, analise in enumerate(analises_ordenadas):
-            cliente = analise.get("cliente", "")
-            scores = analise.get("scores", {})
-            urgencia = scores.get("urgencia", 0)
-            necessidade = scores.get("necessidade", 0)
-            fit = scores.get("fit", 0)
-            prioridade = (urgencia + necessidade + fit) / 3
-            temperatura = analise.get("temperature", "Cold")
-            
+        leads = self._classificar_leads(analises_ordenadas)
+        for cliente, prioridade, temperatura, modelos in zip(
+            leads["cliente"].tolist(), leads["prioridade"].tolist(),
+            leads["temperatura"].tolist(), leads["modelos"].tolist()
+        ):
             # Classifica o lead
             if prioridade >= 0.8:
                 categoria = "🔥 CRÍTICO"
@@ -620,7 +736,7 @@ Atenciosamente,
                 prazo_base = 14  # dias
             
             # Gera sugestões específicas baseadas na análise
-            sugestoes = self._gerar_sugestoes_especificas(analise, prazo_base)
+            sugestoes = self._formatar_sugestoes(modelos, cliente, prazo_base)
             
             lead_info = {
                 "cliente": cliente,
@@ -654,17 +770,17 @@ Atenciosamente,
             {
                 "data": (hoje + timedelta(days=1)).strftime("%Y-%m-%d"),
                 "atividade": "Follow-up imediato com leads críticos",
-                "leads": [l["cliente"] for l in analises_ordenadas[:2] if l.get("scores", {}).get("prioridade", 0) >= 0.8]
+                "leads": [l["cliente"] for l, p in zip(analises_ordenadas[:2], prioridades_ordenadas[:2]) if p >= 0.8]
             },
             {
                 "data": (hoje + timedelta(days=3)).strftime("%Y-%m-%d"),
                 "atividade": "Reuniões de qualificação com leads de alta prioridade",
-                "leads": [l["cliente"] for l in analises_ordenadas[2:4] if l.get("scores", {}).get("prioridade", 0) >= 0.6]
+                "leads": [l["cliente"] for l, p in zip(analises_ordenadas[2:4], prioridades_ordenadas[2:4]) if p >= 0.6]
             },
             {
                 "data": (hoje + timedelta(days=7)).strftime("%Y-%m-%d"),
                 "atividade": "Apresentação de propostas para leads quentes",
-                "leads": [l["cliente"] for l in analises_ordenadas[:3] if l.get("scores", {}).get("prioridade", 0) >= 0.7]
+                "leads": [l["cliente"] for l, p in zip(analises_ordenadas[:3], prioridades_ordenadas[:3]) if p >= 0.7]
             },
             {
                 "data": (hoje + timedelta(days=14)).strftime("%Y-%m-%d"),
@@ -681,136 +797,71 @@ Atenciosamente,
         
         return plano_acao
     
-    def _gerar_sugestoes_especificas(self, analise, prazo_base):
-        """Gera sugestões específicas baseadas na análise do lead"""
-        cliente = analise.get("cliente", "")
-        scores = analise.get("scores", {})
-        urgencia = scores.get("urgencia", 0)
-        necessidade = scores.get("necessidade", 0)
-        fit = scores.get("fit", 0)
-        temperatura = analise.get("temperature", "Cold")
-        
-        sugestoes = []
-        
-        # Sugestões baseadas na urgência
-        if urgencia >= 0.7:
-            sugestoes.append({
-                "acao": f"Ligação imediata para {cliente} - Lead com alta urgência",
-                "prazo": f"{prazo_base} dia(s)",
-                "prioridade": "ALTA",
-                "tipo": "Contato direto"
-            })
-            sugestoes.append({
-                "acao": f"Envio de proposta comercial para {cliente}",
-                "prazo": f"{prazo_base + 1} dia(s)",
-                "prioridade": "ALTA",
-                "tipo": "Proposta"
-            })
-        elif urgencia >= 0.4:
-            sugestoes.append({
-                "acao": f"Email de follow-up para {cliente}",
-                "prazo": f"{prazo_base} dia(s)",
-                "prioridade": "MÉDIA",
-                "tipo": "Follow-up"
-            })
-        
-        # Sugestões baseadas na necessidade
-        if necessidade >= 0.7:
-            sugestoes.append({
-                "acao": f"Agendar reunião de descoberta com {cliente}",
-                "prazo": f"{prazo_base + 2} dias",
-                "prioridade": "ALTA",
-                "tipo": "Reunião"
-            })
-            sugestoes.append({
-                "acao": f"Enviar case de sucesso relevante para {cliente}",
-                "prazo": f"{prazo_base + 1} dia(s)",
-                "prioridade": "MÉDIA",
-                "tipo": "Conteúdo"
-            })
-        
-        # Sugestões baseadas no fit
-        if fit >= 0.7:
-            sugestoes.append({
-                "acao": f"Preparar demonstração personalizada para {cliente}",
-                "prazo": f"{prazo_base + 3} dias",
-                "prioridade": "ALTA",
-                "tipo": "Demonstração"
-            })
-        elif fit >= 0.4:
-            sugestoes.append({
-                "acao": f"Agendar call de qualificação técnica com {cliente}",
-                "prazo": f"{prazo_base + 5} dias",
-                "prioridade": "MÉDIA",
-                "tipo": "Qualificação"
-            })
-        
-        # Sugestões baseadas na temperatura
-        if temperatura == "Hot":
-            sugestoes.append({
-                "acao": f"Preparar contrato e fechar negócio com {cliente}",
-                "prazo": f"{prazo_base} dia(s)",
-                "prioridade": "CRÍTICA",
-                "tipo": "Fechamento"
-            })
-        elif temperatura == "Warm":
-            sugestoes.append({
-                "acao": f"Nurturing campaign para {cliente}",
-                "prazo": f"{prazo_base + 7} dias",
-                "prioridade": "MÉDIA",
-                "tipo": "Nurturing"
-            })
-        else:
-            sugestoes.append({
-                "acao": f"Educação e awareness para {cliente}",
-                "prazo": f"{prazo_base + 14} dias",
-                "prioridade": "BAIXA",
-                "tipo": "Educação"
-            })
-        
-        # Adiciona sugestões genéricas baseadas na prioridade
-        prioridade = (urgencia + necessidade + fit) / 3
-        if prioridade >= 0.8:
-            sugestoes.append({
-                "acao": f"Envolver gestor sênior no deal {cliente}",
-                "prazo": f"{prazo_base} dia(s)",
-                "prioridade": "ALTA",
-                "tipo": "Gestão"
-            })
+    def _formatar_sugestoes(self, modelos, cliente, prazo_base):
+        """Preenche os modelos de sugestão com o cliente e os prazos"""
+        valores = {"cliente": cliente}
+        return [
+            {
+                "acao": acao.format_map(valores),
+                "prazo": prazo.format(dias=prazo_base + offset),
+                "prioridade": prioridade,
+                "tipo": tipo
+            }
+            for acao, offset, prazo, prioridade, tipo in modelos
+        ]
+    
+    def _classificar_leads(self, analises):
+        """Monta DataFrame dos leads já unido à tabela de sugestões por faixa de score"""
+        leads = pd.DataFrame({
+            "cliente": [a.get("cliente", "") for a in analises],
+            "urgencia": [a.get("scores", {}).get("urgencia", 0) for a in analises],
+            "necessidade": [a.get("scores", {}).get("necessidade", 0) for a in analises],
+            "fit": [a.get("scores", {}).get("fit", 0) for a in analises],
+            "temperatura": [a.get("temperature", "Cold") for a in analises]
+        })
+        leads["prioridade"] = (leads["urgencia"] + leads["necessidade"] + leads["fit"]) / 3
+        
+        # Chaves da tabela de sugestões calculadas de uma vez para todos os leads
+        for coluna in ("urgencia", "necessidade", "fit"):
+            leads[f"{coluna}_faixa"] = pd.cut(
+                leads[coluna], bins=_LIMITES_FAIXA, labels=_ROTULOS_FAIXA, right=False
+            ).astype(str)
+        leads["temperatura_chave"] = leads["temperatura"].where(
+            leads["temperatura"].isin(["Hot", "Warm"]), "Cold"
+        )
+        leads["critico"] = leads["prioridade"] >= 0.8
         
-        return sugestoes[:5]  # Máximo 5 sugestões por lead
+        return leads.merge(_TABELA_SUGESTOES_DF, on=list(_CHAVES_SUGESTOES), how="left", sort=False)
     
     def _salvar_plano_acao(self, plano_acao):
         """Salva o plano de ação em arquivos organizados"""
         # Salva JSON completo
-        (self.output_dir / "plano_acao_completo.json").write_text(
-            json.dumps(plano_acao, indent=2, ensure_ascii=False), 
-            encoding="utf-8"
-        )
+        with (self.output_dir / "plano_acao_completo.json").open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(plano_acao, f, indent=2, ensure_ascii=False)
         
         # Salva resumo executivo
-        resumo = f"""PLANO DE AÇÃO ESTRATÉGICO
+        partes = [f"""PLANO DE AÇÃO ESTRATÉGICO
 Gerado em: {plano_acao['data_geracao']}
 
 RESUMO EXECUTIVO:
 {plano_acao['resumo_executivo']}
 
 LEADS POR PRIORIDADE:
-"""
+"""]
         for lead in plano_acao['leads_por_prioridade']:
-            resumo += f"\n{lead['categoria']} - {lead['cliente']} (Prioridade: {lead['prioridade']})"
+            partes.append(f"\n{lead['categoria']} - {lead['cliente']} (Prioridade: {lead['prioridade']})")
             for sugestao in lead['sugestoes'][:3]:  # Top 3 sugestões
-                resumo += f"\n  • {sugestao['acao']} ({sugestao['prazo']})"
+                partes.append(f"\n  • {sugestao['acao']} ({sugestao['prazo']})")
         
-        resumo += f"\n\nAÇÕES IMEDIATAS ({len(plano_acao['acoes_imediatas'])} ações):\n"
+        partes.append(f"\n\nAÇÕES IMEDIATAS ({len(plano_acao['acoes_imediatas'])} ações):\n")
         for acao in plano_acao['acoes_imediatas']:
-            resumo += f"• {acao['acao']} ({acao['prazo']})\n"
+            partes.append(f"• {acao['acao']} ({acao['prazo']})\n")
         
-        resumo += f"\nCALENDÁRIO SUGERIDO:\n"
+        partes.append("\nCALENDÁRIO SUGERIDO:\n")
         for evento in plano_acao['calendario_sugerido']:
-            resumo += f"• {evento['data']}: {evento['atividade']}\n"
+            partes.append(f"• {evento['data']}: {evento['atividade']}\n")
         
-        (self.output_dir / "plano_acao_resumo.txt").write_text(resumo, encoding="utf-8")
+        (self.output_dir / "plano_acao_resumo.txt").write_text("".join(partes), encoding="utf-8")
         
         # Salva CSV para Excel
         dados_csv = []
@@ -827,8 +878,10 @@ LEADS POR PRIORIDADE:
                     'Tipo': sugestao['tipo']
                 })
         
-        df = pd.DataFrame(dados_csv)
-        df.to_csv(self.output_dir / "plano_acao_detalhado.csv", index=False, encoding="utf-8")
+        with open(self.output_dir / "plano_acao_detalhado.csv", "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=_CAMPOS_CSV_PLANO, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(dados_csv)
         
         print(f"✓ Plano de ação salvo em: {self.output_dir}")
     
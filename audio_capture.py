@@ -5,8 +5,8 @@ Sistema robusto de captura e processamento de áudio em tempo real
 """
 
 import threading
-import queue
 import time
+from collections import deque
 import numpy as np
 from typing import Callable, Optional
 from dataclasses import dataclass
@@ -19,12 +19,62 @@ from loguru import logger
 
 from config import Config
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 console = Console()
 
+def _audio_stats_normalize_loop(data: np.ndarray, out: np.ndarray, step: int):
+    """Calcula (rms, pico) e, se out tiver o tamanho de data, grava data normalizado (pico 0.9)
+    
+    O RMS usado na detecção de voz é estimado com uma amostra a cada `step`;
+    o pico continua considerando todas as amostras.
+    """
+    acc = 0.0
+    peak = 0.0
+    probes = 0
+    n = data.size
+    for j in range(0, n, step):
+        v = data[j]
+        acc += v * v
+        probes += 1
+        for i in range(j, min(j + step, n)):
+            a = abs(data[i])
+            if a > peak:
+                peak = a
+    
+    if out.size == n and peak > 0:
+        scale = 0.9 / peak
+        for i in range(n):
+            out[i] = data[i] * scale
+    
+    rms = (acc / probes) ** 0.5 if probes > 0 else 0.0
+    return rms, peak
+
+def _audio_stats_normalize_numpy(data: np.ndarray, out: np.ndarray, step: int):
+    """Versão NumPy usada quando Numba não está instalado"""
+    if data.size == 0:
+        return 0.0, 0.0
+    probe = data[::step]
+    rms = float(np.sqrt(np.dot(probe, probe) / probe.size))
+    peak = float(np.max(np.abs(data)))
+    if out.size == data.size and peak > 0:
+        np.multiply(data, 0.9 / peak, out=out)
+    return rms, peak
+
+if NUMBA_AVAILABLE:
+    # Kernel fundido: RMS, pico e normalização sem passadas extras sobre o chunk
+    _audio_stats_normalize = njit(cache=True, fastmath=True)(_audio_stats_normalize_loop)
+else:
+    _audio_stats_normalize = _audio_stats_normalize_numpy
+
 @dataclass
 class AudioChunk:
     """Representa um pedaço de áudio capturado"""
-    data: np.ndarray
+    data: np.ndarray  # float32 mono
     timestamp: float
     duration: float
     is_speech: bool
@@ -33,10 +83,16 @@ class AudioChunk:
 class AudioCapture:
     """Sistema de captura de áudio em tempo real"""
     
+    # Diretórios de saída já criados neste processo
+    _dirs_ready = False
+    
     def __init__(self, callback: Optional[Callable[[AudioChunk], None]] = None):
         self.callback = callback
         self.is_recording = False
-        self.audio_queue = queue.Queue()
+        # Fila produtor/consumidor único: deque é atômico sob o GIL e o Event
+        # acorda a thread de processamento sem o Condition do queue.Queue
+        self.audio_queue = deque(maxlen=64)
+        self._chunk_ready = threading.Event()
         
         # Configurações de áudio
         self.sample_rate = Config.SAMPLE_RATE
@@ -44,8 +100,19 @@ class AudioCapture:
         self.chunk_duration = Config.CHUNK_DURATION
         self.frames_per_chunk = int(self.sample_rate * self.chunk_duration)
         
-        # Buffer para acumular frames
-        self.audio_buffer = []
+        # Chunks pequenos são pedidos diretamente ao stream; os maiores são
+        # acumulados a partir de blocos de 1024 frames para manter baixa latência
+        self.blocksize = self.frames_per_chunk if self.frames_per_chunk <= 4096 else 1024
+        
+        # Buffers float32 pré-alocados, usados em rodízio: o chunk completo é
+        # entregue à fila sem cópia enquanto o próximo buffer é preenchido. Há um
+        # buffer por posição da fila, mais o que está em processamento e o que
+        # está sendo preenchido. Com a fila cheia o chunk novo é descartado e seu
+        # buffer reaproveitado, então nenhum é reutilizado antes de ser consumido
+        self._chunk_pool = np.empty((self.audio_queue.maxlen + 2, self.frames_per_chunk), dtype=np.float32)
+        self._pool_idx = 0
+        self.audio_buffer = self._chunk_pool[0]
+        self.buffer_fill = 0
         self.buffer_lock = threading.Lock()
         
         # Configurações de detecção de voz
@@ -53,6 +120,22 @@ class AudioCapture:
         self.min_speech_duration = 0.5  # segundos
         self.max_silence_duration = 1.0  # segundos
         
+        # A amplitude para detecção de voz só precisa de resolução de ~1 kHz
+        self.vad_step = max(1, self.sample_rate // 1000)
+        
+        # O kernel Numba compila na primeira chamada: aquece aqui, com os mesmos
+        # tipos do callback, para a compilação não cair dentro do PortAudio
+        warmup = np.zeros(16, dtype=np.float32)
+        _audio_stats_normalize(warmup, warmup, self.vad_step)
+        
+        # Filtro passa-alta projetado uma única vez; o estado (zi) é mantido
+        # entre chunks para evitar descontinuidades nas bordas
+        self._hp_sos = signal.butter(
+            4, 80, btype='highpass', fs=self.sample_rate, output='sos'
+        ).astype(np.float32)
+        self._hp_zi_base = signal.sosfilt_zi(self._hp_sos).astype(np.float32)
+        self._hp_zi = None
+        
         # Thread de processamento
         self.processing_thread = None
         self.should_stop = threading.Event()
@@ -74,34 +157,59 @@ class AudioCapture:
         """Callback chamado pelo sounddevice para cada chunk de áudio"""
         if status:
             logger.warning(f"Audio callback status: {status}")
-            
-        # Copia dados para evitar problemas de concorrência
-        audio_data = indata.copy()
+        
+        # indata é o buffer bruto do PortAudio, válido apenas durante o callback:
+        # a view NumPy só é criada aqui e os dados são copiados logo em seguida
+        samples = np.frombuffer(indata, dtype=np.float32, count=frames * self.channels)
+        
+        # Bloco do tamanho exato do chunk: dispensa o buffer de acumulação
+        if samples.size == self.frames_per_chunk and self.buffer_fill == 0:
+            np.copyto(self.audio_buffer, samples)
+            self._emit_chunk()
+            return
         
         with self.buffer_lock:
-            self.audio_buffer.extend(audio_data.flatten())
-            
-            # Quando buffer atinge tamanho do chunk, processa
-            if len(self.audio_buffer) >= self.frames_per_chunk:
-                chunk_data = np.array(self.audio_buffer[:self.frames_per_chunk])
-                self.audio_buffer = self.audio_buffer[self.frames_per_chunk:]
+            offset = 0
+            while offset < samples.size:
+                take = min(self.frames_per_chunk - self.buffer_fill, samples.size - offset)
+                self.audio_buffer[self.buffer_fill:self.buffer_fill + take] = samples[offset:offset + take]
+                self.buffer_fill += take
+                offset += take
                 
-                # Cria chunk de áudio
-                audio_chunk = self._create_audio_chunk(chunk_data)
-                
-                # Adiciona à fila para processamento
-                try:
-                    self.audio_queue.put_nowait(audio_chunk)
-                except queue.Full:
-                    logger.warning("⚠️ Fila de áudio cheia, descartando chunk")
+                # Quando buffer atinge tamanho do chunk, processa
+                if self.buffer_fill == self.frames_per_chunk:
+                    self.buffer_fill = 0
+                    self._emit_chunk()
+    
+    def _emit_chunk(self):
+        """Entrega o buffer cheio à fila; com a fila cheia descarta o chunk e reaproveita o buffer"""
+        # Só o consumidor remove itens, então a fila não enche entre a checagem e o append
+        if len(self.audio_queue) == self.audio_queue.maxlen:
+            logger.warning("⚠️ Fila de áudio cheia, descartando chunk")
+            return
+        self._enqueue_chunk(self._next_buffer())
+    
+    def _next_buffer(self) -> np.ndarray:
+        """Libera o buffer cheio para a fila e passa a preencher o próximo do rodízio"""
+        full = self.audio_buffer
+        self._pool_idx = (self._pool_idx + 1) % len(self._chunk_pool)
+        self.audio_buffer = self._chunk_pool[self._pool_idx]
+        return full
+    
+    def _enqueue_chunk(self, chunk_data: np.ndarray):
+        """Cria o AudioChunk e o entrega à thread de processamento"""
+        audio_chunk = self._create_audio_chunk(chunk_data)
+        self.audio_queue.append(audio_chunk)
+        self._chunk_ready.set()
     
     def _create_audio_chunk(self, data: np.ndarray) -> AudioChunk:
-        """Cria objeto AudioChunk com análise básica"""
+        """Cria objeto AudioChunk com análise básica e áudio já normalizado"""
         timestamp = time.time()
         duration = len(data) / self.sample_rate
         
-        # Calcula amplitude RMS
-        amplitude = np.sqrt(np.mean(data**2))
+        # Amplitude RMS e normalização (in-place) na mesma passada
+        amplitude, _ = _audio_stats_normalize(data, data, self.vad_step)
+        amplitude = float(amplitude)
         
         # Detecta se é fala (básico por amplitude)
         is_speech = amplitude > self.silence_threshold
@@ -115,14 +223,11 @@ class AudioCapture:
         )
     
     def _enhance_audio(self, data: np.ndarray) -> np.ndarray:
-        """Aplica melhorias básicas no áudio"""
-        # Normalização
-        if np.max(np.abs(data)) > 0:
-            data = data / np.max(np.abs(data)) * 0.9
-            
+        """Aplica melhorias básicas no áudio (a normalização é feita em _create_audio_chunk)"""
         # Filtro passa-alta para remover ruído de baixa frequência
-        sos = signal.butter(4, 80, btype='highpass', fs=self.sample_rate, output='sos')
-        data = signal.sosfilt(sos, data)
+        if self._hp_zi is None:
+            self._hp_zi = self._hp_zi_base * data[0]
+        data, self._hp_zi = signal.sosfilt(self._hp_sos, data, zi=self._hp_zi)
         
         return data
     
@@ -131,25 +236,28 @@ class AudioCapture:
         logger.info("🔄 Thread de processamento de áudio iniciada")
         
         while not self.should_stop.is_set():
-            try:
-                # Pega chunk da fila com timeout
-                audio_chunk = self.audio_queue.get(timeout=0.1)
-                
-                # Aplica melhorias no áudio
-                enhanced_data = self._enhance_audio(audio_chunk.data)
-                audio_chunk.data = enhanced_data
-                
-                # Chama callback se fornecido
-                if self.callback and audio_chunk.is_speech:
-                    try:
-                        self.callback(audio_chunk)
-                    except Exception as e:
-                        logger.error(f"❌ Erro no callback: {e}")
-                        
-            except queue.Empty:
+            # Aguarda novos chunks com timeout
+            if not self._chunk_ready.wait(timeout=0.1):
                 continue
-            except Exception as e:
-                logger.error(f"❌ Erro no processamento de áudio: {e}")
+            self._chunk_ready.clear()
+            
+            while self.audio_queue:
+                try:
+                    audio_chunk = self.audio_queue.popleft()
+                    
+                    # Aplica melhorias no áudio
+                    enhanced_data = self._enhance_audio(audio_chunk.data)
+                    audio_chunk.data = enhanced_data
+                    
+                    # Chama callback se fornecido
+                    if self.callback and audio_chunk.is_speech:
+                        try:
+                            self.callback(audio_chunk)
+                        except Exception as e:
+                            logger.error(f"❌ Erro no callback: {e}")
+                            
+                except Exception as e:
+                    logger.error(f"❌ Erro no processamento de áudio: {e}")
         
         logger.info("🔄 Thread de processamento de áudio finalizada")
     
@@ -160,6 +268,9 @@ class AudioCapture:
             return
             
         try:
+            # Reinicia estado do filtro para a nova sessão
+            self._hp_zi = None
+            
             # Inicia thread de processamento
             self.should_stop.clear()
             self.processing_thread = threading.Thread(
@@ -169,13 +280,13 @@ class AudioCapture:
             self.processing_thread.start()
             
             # Inicia stream de áudio
-            self.stream = sd.InputStream(
+            self.stream = sd.RawInputStream(
                 device=device_index,
                 channels=self.channels,
                 samplerate=self.sample_rate,
                 callback=self.audio_callback,
-                blocksize=1024,  # Blocks pequenos para baixa latência
-                dtype=np.float32
+                blocksize=self.blocksize,
+                dtype='float32'
             )
             
             self.stream.start()
@@ -215,11 +326,13 @@ class AudioCapture:
     
     def save_audio_chunk(self, audio_chunk: AudioChunk, filename: str):
         """Salva chunk de áudio em arquivo"""
-        Config.create_directories()
+        if not AudioCapture._dirs_ready:
+            Config.create_directories()
+            AudioCapture._dirs_ready = True
         filepath = Config.TEMP_DIR / filename
         
         try:
-            sf.write(str(filepath), audio_chunk.data, self.sample_rate)
+            sf.write(str(filepath), audio_chunk.data.astype(np.float32, copy=False), self.sample_rate)
             logger.info(f"💾 Áudio salvo: {filepath}")
             return str(filepath)
         except Exception as e:
@@ -233,8 +346,8 @@ class AudioCapture:
             "sample_rate": self.sample_rate,
             "channels": self.channels,
             "chunk_duration": self.chunk_duration,
-            "queue_size": self.audio_queue.qsize(),
-            "buffer_size": len(self.audio_buffer) if hasattr(self, 'audio_buffer') else 0
+            "queue_size": len(self.audio_queue),
+            "buffer_size": self.buffer_fill
         }
 
 class SpeechDetector:
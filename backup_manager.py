@@ -6,14 +6,22 @@
 Sistema automático de backup e restauração de configurações
 """
 
+import io
 import os
+import sys
+import errno
+import queue
+import asyncio
 import json
 import shutil
 import zipfile
+import tarfile
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 import threading
 import time
@@ -24,8 +32,456 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from loguru import logger
 
+from json_utils import dumps_json, loads_json
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    # zlib-ng gera DEFLATE compatível, cerca de 2x mais rápido que a zlib padrão
+    # (usado só durante a escrita dos backups ZIP, ver _zip_deflate_backend)
+    from zlib_ng import zlib_ng
+    ZLIB_NG_AVAILABLE = True
+except ImportError:
+    ZLIB_NG_AVAILABLE = False
+
+try:
+    if sys.platform != "linux":
+        raise ImportError("io_uring disponível apenas no Linux")
+    import liburing
+    LIBURING_AVAILABLE = True
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    from fastcdc import fastcdc
+    FASTCDC_AVAILABLE = True
+except ImportError:
+    FASTCDC_AVAILABLE = False
+
 console = Console()
 
+# Arquivos acima deste tamanho são hasheados via mmap com BLAKE3 multithread
+MMAP_HASH_THRESHOLD = 8 * 1024 * 1024
+
+# Nível DEFLATE: backups automáticos priorizam velocidade
+AUTO_BACKUP_COMPRESSLEVEL = 1
+MANUAL_BACKUP_COMPRESSLEVEL = 6
+
+# io_uring: leituras de 1 MiB com até 64 operações em voo por arquivo
+URING_DEPTH = 64
+URING_BLOCK_SIZE = 1 << 20
+URING_MAX_RINGS = 2  # Cada ring mantém URING_DEPTH buffers registrados (64 MiB)
+
+# Nível zstd (formato tar.zst)
+AUTO_BACKUP_ZSTD_LEVEL = 3
+MANUAL_BACKUP_ZSTD_LEVEL = 9
+TAR_ZST_SUFFIX = ".tar.zst"
+
+# No ZIP, arquivos pequenos vão sem compressão: inicializar o deflate custa mais que o ganho
+ZIP_STORE_THRESHOLD = 1024
+
+# Buffer dos arquivos de backup comprimidos (evita milhares de escritas pequenas)
+ARCHIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Threads usadas para copiar/hashear os arquivos do backup
+COPY_WORKERS = 16
+
+# Intervalo mínimo entre atualizações da barra de progresso (segundos)
+PROGRESS_INTERVAL = 0.1
+
+# Content-defined chunking do repositório deduplicado (backups/.chunks)
+CHUNK_MIN_SIZE = 16 * 1024
+CHUNK_AVG_SIZE = 64 * 1024
+CHUNK_MAX_SIZE = 256 * 1024
+MANIFEST_FILE = "manifest.json"
+
+# Tabela do gear hash, derivada de forma determinística para que os cortes
+# sejam estáveis entre execuções e máquinas
+_GEAR = tuple(
+    int.from_bytes(hashlib.blake2b(bytes([i]), digest_size=8).digest(), "little")
+    for i in range(256)
+)
+_U64 = (1 << 64) - 1
+_CDC_MASK = 0xFFFF << 48  # 16 bits → corte a cada ~64 KiB
+
+def _gear_cut(buf: bytearray, size: int) -> int:
+    """Retorna o tamanho do próximo chunk no início de buf (gear hash)"""
+    if size <= CHUNK_MIN_SIZE:
+        return size
+    
+    limit = min(size, CHUNK_MAX_SIZE)
+    h = 0
+    for i in range(CHUNK_MIN_SIZE, limit):
+        h = ((h << 1) + _GEAR[buf[i]]) & _U64
+        if not h & _CDC_MASK:
+            return i + 1
+    return limit
+
+def _iter_file_chunks(file_path: Path):
+    """Divide um arquivo em chunks definidos pelo conteúdo"""
+    if FASTCDC_AVAILABLE:
+        for chunk in fastcdc(str(file_path), CHUNK_MIN_SIZE, CHUNK_AVG_SIZE, CHUNK_MAX_SIZE, fat=True):
+            yield chunk.data
+        return
+    
+    pending = bytearray()
+    with open(file_path, 'rb') as f:
+        eof = False
+        while not eof or pending:
+            while not eof and len(pending) < CHUNK_MAX_SIZE:
+                block = f.read(1 << 20)
+                if not block:
+                    eof = True
+                pending += block
+            
+            if not pending:
+                break
+            
+            cut = _gear_cut(pending, len(pending))
+            yield bytes(pending[:cut])
+            del pending[:cut]
+
+# Erros que indicam cópia no kernel indisponível para o par de arquivos
+_KERNEL_COPY_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+class UringIO:
+    """Leitura e cópia de arquivos via io_uring, com várias operações em voo"""
+    
+    def __init__(self, depth: int = URING_DEPTH, block_size: int = URING_BLOCK_SIZE):
+        self.depth = depth
+        self.block_size = block_size
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth * 2, self.ring)
+        try:
+            self.buffers = [bytearray(block_size) for _ in range(depth)]
+            
+            # Buffers registrados uma vez por ring: READ_FIXED/WRITE_FIXED evitam
+            # fixar e liberar as páginas a cada operação
+            try:
+                self._iovec = liburing.Iovec(self.buffers)
+                self.fixed = liburing.io_uring_register_buffers(self.ring, self._iovec) == 0
+            except Exception as e:
+                logger.debug(f"io_uring sem buffers registrados: {e}")
+                self.fixed = False
+        except BaseException:
+            # Ring já criado: libera antes de propagar (senão vaza a cada tentativa)
+            liburing.io_uring_queue_exit(self.ring)
+            raise
+    
+    def close(self):
+        liburing.io_uring_queue_exit(self.ring)
+    
+    def _prep_read(self, fd: int, buf: bytearray, slot: Optional[int], offset: int):
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        if self.fixed and slot is not None:
+            liburing.io_uring_prep_read_fixed(sqe, fd, buf, slot, offset)
+        else:
+            liburing.io_uring_prep_read(sqe, fd, buf, offset)
+        return sqe
+    
+    def _prep_write(self, fd: int, buf: bytearray, slot: Optional[int], offset: int):
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        if self.fixed and slot is not None:
+            liburing.io_uring_prep_write_fixed(sqe, fd, buf, slot, offset)
+        else:
+            liburing.io_uring_prep_write(sqe, fd, buf, offset)
+        return sqe
+    
+    def _reap(self) -> Tuple[int, int]:
+        """Aguarda uma conclusão e retorna (user_data, resultado)"""
+        liburing.io_uring_wait_cqe(self.ring, self.cqe)
+        cqe = self.cqe[0]
+        user_data, res = liburing.io_uring_cqe_get_data64(cqe), cqe.res
+        liburing.io_uring_cqe_seen(self.ring, cqe)
+        if res < 0:
+            raise OSError(-res, os.strerror(-res))
+        return user_data, res
+    
+    def iter_blocks(self, fd: int, size: int):
+        """Lê o arquivo em blocos, entregues em ordem; cada bloco vale até a próxima iteração"""
+        n_blocks = -(-size // self.block_size)
+        done = {}
+        next_submit = next_yield = 0
+        
+        while next_yield < n_blocks:
+            # Mantém até `depth` leituras em voo sem reutilizar buffers ainda não consumidos
+            while next_submit < n_blocks and next_submit - next_yield < self.depth:
+                slot = next_submit % self.depth
+                sqe = self._prep_read(fd, self.buffers[slot], slot, next_submit * self.block_size)
+                liburing.io_uring_sqe_set_data64(sqe, next_submit)
+                next_submit += 1
+            liburing.io_uring_submit(self.ring)
+            
+            while next_yield not in done:
+                index, res = self._reap()
+                done[index] = res
+            
+            while next_yield in done:
+                res = done.pop(next_yield)
+                expected = min(self.block_size, size - next_yield * self.block_size)
+                block = memoryview(self.buffers[next_yield % self.depth])[:res]
+                if res < expected:
+                    # Leitura curta: completa de forma síncrona
+                    block = bytes(block) + os.pread(fd, expected - res, next_yield * self.block_size + res)
+                yield block
+                next_yield += 1
+    
+    def copy(self, in_fd: int, out_fd: int, size: int):
+        """Copia o arquivo com pares leitura→escrita encadeados (IOSQE_IO_LINK)"""
+        offset = 0
+        while offset < size:
+            batch = []
+            for slot in range(self.depth):
+                if offset >= size:
+                    break
+                length = min(self.block_size, size - offset)
+                if length == self.block_size:
+                    buf, buf_index = self.buffers[slot], slot
+                else:
+                    # Último bloco: a escrita precisa do tamanho exato
+                    buf, buf_index = bytearray(length), None
+                
+                sqe = self._prep_read(in_fd, buf, buf_index, offset)
+                liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+                liburing.io_uring_sqe_set_data64(sqe, 2 * slot)
+                
+                sqe = self._prep_write(out_fd, buf, buf_index, offset)
+                liburing.io_uring_sqe_set_data64(sqe, 2 * slot + 1)
+                
+                batch.append(length)
+                offset += length
+            
+            liburing.io_uring_submit(self.ring)
+            for _ in range(2 * len(batch)):
+                user_data, res = self._reap()
+                if res != batch[user_data // 2]:
+                    raise OSError(errno.EIO, "Cópia via io_uring incompleta")
+
+# Rings reutilizados entre threads e backups (criar um ring por arquivo custa caro)
+_URING_POOL = queue.SimpleQueue()
+_URING_SLOTS = threading.BoundedSemaphore(URING_MAX_RINGS)
+
+# Primeira falha do io_uring (seccomp, ENOMEM, erro do binding...) o desliga no processo
+_URING_DISABLED = threading.Event()
+
+def _uring_enabled() -> bool:
+    return LIBURING_AVAILABLE and not _URING_DISABLED.is_set()
+
+def _disable_uring(error: BaseException):
+    if not _URING_DISABLED.is_set():
+        _URING_DISABLED.set()
+        logger.debug(f"io_uring desativado: {error!r}")
+
+@contextmanager
+def _uring():
+    """Empresta um UringIO do pool, ou None se todos estão em uso
+    
+    Em caso de erro o ring é descartado em vez de voltar ao pool.
+    """
+    if not _URING_SLOTS.acquire(blocking=False):
+        yield None
+        return
+    
+    try:
+        try:
+            uring = _URING_POOL.get_nowait()
+        except queue.Empty:
+            uring = UringIO()
+        
+        try:
+            yield uring
+        except BaseException:
+            uring.close()
+            raise
+        _URING_POOL.put(uring)
+    finally:
+        _URING_SLOTS.release()
+
+def _uring_copy(in_fd: int, out_fd: int) -> bool:
+    """Copia via io_uring; retorna False se o ring não puder ser usado"""
+    try:
+        with _uring() as uring:
+            if uring is None:
+                return False
+            uring.copy(in_fd, out_fd, os.fstat(in_fd).st_size)
+        return True
+    except Exception as e:
+        _disable_uring(e)
+        return False
+
+def _uring_hash(file_path: Union[str, Path], size: int) -> Optional[bytes]:
+    """Digest lendo vários blocos em paralelo pelo io_uring; None se o ring não puder ser usado"""
+    fd = _open_source(file_path)
+    try:
+        hasher = _new_hasher()
+        with _uring() as uring:
+            if uring is None:
+                return None
+            for block in uring.iter_blocks(fd, size):
+                hasher.update(block)
+        return hasher.digest()
+    except Exception as e:
+        _disable_uring(e)
+        return None
+    finally:
+        os.close(fd)
+
+def _open_source(path) -> int:
+    """Abre um arquivo de origem para leitura sem atualizar o atime, quando permitido"""
+    noatime = getattr(os, "O_NOATIME", 0)
+    if noatime:
+        try:
+            return os.open(path, os.O_RDONLY | noatime)
+        except PermissionError:
+            pass  # O_NOATIME exige ser dono do arquivo
+    return os.open(path, os.O_RDONLY)
+
+def _fast_copy(src, dst):
+    """Copia um arquivo dentro do kernel (copy_file_range, io_uring, sendfile)
+    
+    Em sistemas de arquivos CoW o copy_file_range vira reflink. Sem suporte do
+    kernel, cai para shutil.copy2.
+    """
+    in_fd = _open_source(src)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            offset = 0
+            copied = False
+            
+            if hasattr(os, "copy_file_range"):
+                try:
+                    while True:
+                        n = os.copy_file_range(in_fd, out_fd, 1 << 30, offset, offset)
+                        if n == 0:
+                            break
+                        offset += n
+                    copied = True
+                except OSError as e:
+                    if e.errno not in _KERNEL_COPY_ERRNOS:
+                        raise
+            
+            if not copied and _uring_enabled():
+                copied = _uring_copy(in_fd, out_fd)
+            
+            if not copied and hasattr(os, "sendfile"):
+                offset = 0
+                try:
+                    while True:
+                        n = os.sendfile(out_fd, in_fd, offset, 1 << 30)
+                        if n == 0:
+                            break
+                        offset += n
+                    copied = True
+                except OSError as e:
+                    if e.errno not in _KERNEL_COPY_ERRNOS:
+                        raise
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    
+    if not copied:
+        return shutil.copy2(src, dst)
+    
+    shutil.copystat(src, dst)
+    return dst
+
+# zlib original do zipfile e quantas escritas de ZIP estão usando o zlib-ng
+_STDLIB_ZIP_ZLIB = zipfile.zlib
+_ZIP_ZLIB_LOCK = threading.Lock()
+_ZIP_ZLIB_USERS = 0
+
+@contextmanager
+def _zip_deflate_backend():
+    """Troca o zlib do zipfile pelo zlib-ng enquanto um backup ZIP é gravado
+    
+    O zipfile não aceita um compressor por arquivo; a troca vale só durante a
+    escrita e o zlib original volta quando a última escrita em andamento termina.
+    """
+    global _ZIP_ZLIB_USERS
+    if not ZLIB_NG_AVAILABLE:
+        yield
+        return
+    with _ZIP_ZLIB_LOCK:
+        if _ZIP_ZLIB_USERS == 0:
+            zipfile.zlib = zlib_ng
+        _ZIP_ZLIB_USERS += 1
+    try:
+        yield
+    finally:
+        with _ZIP_ZLIB_LOCK:
+            _ZIP_ZLIB_USERS -= 1
+            if _ZIP_ZLIB_USERS == 0:
+                zipfile.zlib = _STDLIB_ZIP_ZLIB
+
+@contextmanager
+def _open_zip(path: Path, mode: str = 'r', **kwargs):
+    """Abre um ZIP sobre um arquivo com buffer grande (escrita com zlib-ng, se disponível)"""
+    buffered = 'rb' if mode == 'r' else 'wb'
+    backend = nullcontext() if mode == 'r' else _zip_deflate_backend()
+    with backend, open(path, buffered, buffering=ARCHIVE_BUFFER_SIZE) as fh:
+        with zipfile.ZipFile(fh, mode, **kwargs) as zipf:
+            yield zipf
+
+@contextmanager
+def _open_tar_zst(path: Path, level: int):
+    """Abre um tar em stream comprimido por zstd multithread para escrita"""
+    with ExitStack() as stack:
+        fh = stack.enter_context(open(path, 'wb', buffering=ARCHIVE_BUFFER_SIZE))
+        cctx = zstandard.ZstdCompressor(level=level, threads=-1)
+        zfh = stack.enter_context(cctx.stream_writer(fh))
+        yield stack.enter_context(tarfile.open(fileobj=zfh, mode='w|'))
+
+@contextmanager
+def _read_tar_zst(path: Path):
+    """Abre um tar.zst para leitura sequencial"""
+    with ExitStack() as stack:
+        fh = stack.enter_context(open(path, 'rb', buffering=ARCHIVE_BUFFER_SIZE))
+        reader = stack.enter_context(zstandard.ZstdDecompressor().stream_reader(fh))
+        yield stack.enter_context(tarfile.open(fileobj=reader, mode='r|'))
+
+def _is_tar_zst(path: Path) -> bool:
+    return path.is_file() and path.name.endswith(TAR_ZST_SUFFIX)
+
+def _walk_files(root, rel_root: str):
+    """Lista (caminho, caminho relativo POSIX) dos arquivos de uma árvore
+    
+    Usa os.scandir: o tipo vem do próprio diretório (d_type), sem stat por entrada.
+    """
+    stack = [(os.fspath(root), rel_root)]
+    while stack:
+        directory, rel_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path))
+                elif entry.is_file():
+                    yield entry.path, rel_path
+
+def _make_dirs(dirs):
+    """Cria um conjunto de diretórios uma única vez, dos mais rasos aos mais profundos"""
+    for directory in sorted(set(dirs), key=lambda d: len(d.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
+
+def _new_hasher():
+    """Retorna um hasher BLAKE3 se disponível, senão BLAKE2b (32 bytes)"""
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=32)
+
 @dataclass
 class BackupInfo:
     """Informações de um backup"""
@@ -37,6 +493,11 @@ class BackupInfo:
     version: str
     checksum: str
     auto_backup: bool = False
+    parent: Optional[str] = None  # Backup base de um backup incremental
+    file_index: Dict[str, Tuple[int, int, str]] = field(default_factory=dict)  # relpath → (size, mtime_ns, digest)
+
+# Campos de BackupInfo na ordem do construtor, para carregar os metadados por posição
+_BACKUP_INFO_FIELDS = tuple(f.name for f in fields(BackupInfo))
 
 @dataclass
 class BackupConfig:
@@ -49,6 +510,10 @@ class BackupConfig:
     compress_backups: bool = True
     include_logs: bool = False
     include_temp: bool = False
+    compression: str = "zstd"  # "zstd" (tar.zst, requer zstandard) ou "zip"
+    deduplicate: bool = False  # Armazena conteúdo em chunks compartilhados entre backups
+    incremental_auto_backup: bool = True  # Backups automáticos copiam só arquivos alterados
+    max_incremental_chain: int = 7  # Incrementais seguidos antes de um novo backup completo
 
 class BackupManager:
     """Gerenciador de backup automático"""
@@ -56,6 +521,8 @@ class BackupManager:
     def __init__(self, base_dir: Path = None):
         self.base_dir = base_dir or Path(__file__).parent
         self.backup_dir = self.base_dir / "backups"
+        self.chunks_dir = self.backup_dir / ".chunks"
+        self._chunk_dirs = set()  # Subdiretórios de .chunks já criados
         self.config_dir = self.base_dir / "config"
         self.backup_dir.mkdir(exist_ok=True)
         self.config_dir.mkdir(exist_ok=True)
@@ -66,6 +533,15 @@ class BackupManager:
         # Thread de backup automático
         self._backup_thread = None
         self._stop_backup_thread = threading.Event()
+        self._backup_loop = None
+        self._backup_task = None
+        
+        # Serializa as escritas no ZIP feitas pelas threads de cópia
+        self._zip_lock = threading.Lock()
+        
+        # Cache de list_backups, válido enquanto o mtime de backups/ não mudar
+        self._backups_cache: Optional[List[BackupInfo]] = None
+        self._backups_cache_mtime = None
         
         # Arquivos e diretórios para backup
         self.backup_items = self._get_backup_items()
@@ -80,9 +556,7 @@ class BackupManager:
         
         if config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return BackupConfig(**data)
+                return BackupConfig(**loads_json(config_file.read_bytes()))
             except Exception as e:
                 logger.error(f"Erro ao carregar config de backup: {e}")
                 return default_config
@@ -96,8 +570,7 @@ class BackupManager:
         config_file = self.config_dir / "backup_config.json"
         
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(config), f, indent=2, ensure_ascii=False)
+            config_file.write_bytes(dumps_json(config))
         except Exception as e:
             logger.error(f"Erro ao salvar config de backup: {e}")
     
@@ -148,8 +621,13 @@ class BackupManager:
             }
         ]
     
-    def create_backup(self, name: str = None, description: str = "", auto: bool = False) -> BackupInfo:
-        """Cria um novo backup"""
+    def create_backup(self, name: str = None, description: str = "", auto: bool = False,
+                      incremental: bool = False) -> BackupInfo:
+        """Cria um novo backup
+        
+        No modo incremental, arquivos com mesmo tamanho e mtime do backup mais
+        recente não são copiados; o backup guarda apenas o índice e aponta para o pai.
+        """
         if not self.config.enabled:
             logger.info("Backup desabilitado")
             return None
@@ -173,13 +651,33 @@ class BackupManager:
                 
                 task = progress.add_task("Preparando backup...", total=None)
                 
-                # Cria diretório do backup
-                backup_path.mkdir(exist_ok=True)
+                compress = self.config.compress_backups
+                use_zstd = compress and self.config.compression == "zstd" and ZSTD_AVAILABLE
+                if use_zstd:
+                    # tar.zst: um único stream zstd; arquivos entram em sequência após o hash
+                    backup_path = self.backup_dir / f"{name}{TAR_ZST_SUFFIX}"
+                elif compress:
+                    # Backups comprimidos são gravados direto no ZIP, sem cópia intermediária
+                    backup_path = self.backup_dir / f"{name}.zip"
+                else:
+                    # Cria diretório do backup
+                    backup_path.mkdir(exist_ok=True)
                 
                 files_copied = 0
                 total_size = 0
                 
-                # Copia arquivos
+                # Com deduplicação, o backup guarda só o manifesto dos chunks
+                deduplicate = self.config.deduplicate
+                manifest = [] if deduplicate else None
+                
+                parent = self._find_incremental_parent() if incremental else None
+                parent_index = parent.file_index if parent else {}
+                file_index = {}
+                files_changed = 0
+                stored_digests = []  # (rel_path, digest) dos arquivos gravados neste backup
+                
+                # Lista os arquivos antes de copiar
+                jobs = []
                 for item in self.backup_items:
                     if not item.get("include", True):
                         continue
@@ -188,50 +686,96 @@ class BackupManager:
                     if not source_path.exists():
                         continue
                     
-                    progress.update(task, description=f"Copiando {item['description']}...")
-                    
                     if source_path.is_file():
                         # Arquivo único
-                        dest_path = backup_path / item["path"]
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        shutil.copy2(source_path, dest_path)
-                        files_copied += 1
-                        total_size += source_path.stat().st_size
+                        jobs.append((source_path, item["path"]))
                         
                     elif source_path.is_dir() and item.get("recursive", False):
                         # Diretório recursivo
-                        dest_path = backup_path / item["path"]
-                        
-                        for root, dirs, files in os.walk(source_path):
-                            for file in files:
-                                src_file = Path(root) / file
-                                rel_path = src_file.relative_to(source_path)
-                                dst_file = dest_path / rel_path
-                                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                                
-                                shutil.copy2(src_file, dst_file)
-                                files_copied += 1
-                                total_size += src_file.stat().st_size
+                        jobs.extend(_walk_files(source_path, item["path"].rstrip("/")))
                 
-                # Cria arquivo de metadados
-                metadata = {
-                    "name": name,
-                    "timestamp": datetime.now().isoformat(),
-                    "description": description,
-                    "version": "1.0.0",
-                    "files_count": files_copied,
-                    "size": total_size,
-                    "auto_backup": auto,
-                    "config": asdict(self.config)
-                }
+                # Cria os diretórios de destino de uma vez, fora das threads
+                if not deduplicate and not compress:
+                    _make_dirs((backup_path / rel_path).parent for _, rel_path in jobs)
                 
-                metadata_file = backup_path / "backup_info.json"
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                # Copia arquivos em paralelo; os resultados voltam na ordem dos jobs
+                progress.update(task, description=f"Copiando {len(jobs)} arquivos...", total=len(jobs))
                 
-                # Calcula checksum
-                checksum = self._calculate_checksum(backup_path)
+                if use_zstd:
+                    archive = _open_tar_zst(backup_path, AUTO_BACKUP_ZSTD_LEVEL if auto else MANUAL_BACKUP_ZSTD_LEVEL)
+                elif compress:
+                    compresslevel = AUTO_BACKUP_COMPRESSLEVEL if auto else MANUAL_BACKUP_COMPRESSLEVEL
+                    archive = _open_zip(backup_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+                else:
+                    archive = nullcontext(backup_path)
+                
+                pending_tar = []  # (src_file, rel_path) gravados no tar depois dos metadados
+                with archive as target:
+                    
+                    def backup_job(job):
+                        # Backups automáticos abortam assim que o loop é parado
+                        if auto and self._stop_backup_thread.is_set():
+                            raise RuntimeError("Backup automático cancelado")
+                        return self._backup_file(job[0], job[1], target, deduplicate, parent_index)
+                    
+                    # A barra é atualizada só nesta thread, no máximo a cada PROGRESS_INTERVAL
+                    last_update = time.monotonic()
+                    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                        results = executor.map(backup_job, jobs)
+                        for done, (job, (rel_path, entry, chunks, changed)) in enumerate(zip(jobs, results), 1):
+                            file_index[rel_path] = entry
+                            if chunks is not None:
+                                manifest.append([rel_path, chunks])
+                            if changed:
+                                stored_digests.append((rel_path, entry[2]))
+                                if use_zstd and not deduplicate:
+                                    pending_tar.append(job)
+                            files_changed += changed
+                            files_copied += 1
+                            total_size += entry[0]
+                            
+                            now = time.monotonic()
+                            if now - last_update >= PROGRESS_INTERVAL:
+                                progress.update(task, completed=done)
+                                last_update = now
+                    
+                    if manifest is not None:
+                        self._write_backup_member(target, MANIFEST_FILE,
+                                                  json.dumps(manifest, ensure_ascii=False).encode("utf-8"))
+                    
+                    # Checksum a partir dos digests calculados durante a cópia
+                    checksum = self._calculate_checksum(stored_digests)
+                    
+                    # Cria arquivo de metadados, gravado uma única vez já com o checksum
+                    metadata = {
+                        "name": name,
+                        "timestamp": datetime.now().isoformat(),
+                        "description": description,
+                        "version": "1.0.0",
+                        "files_count": files_copied,
+                        "size": total_size,
+                        "auto_backup": auto,
+                        "parent": parent.name if parent else None,
+                        "file_index": file_index,
+                        "config": self.config,
+                        "checksum": checksum
+                    }
+                    
+                    self._write_backup_member(target, "backup_info.json", dumps_json(metadata))
+                    
+                    # No tar.zst os metadados vêm primeiro, para serem lidos sem descomprimir tudo
+                    if pending_tar:
+                        progress.update(task, description="Comprimindo backup...")
+                        # Agrupa por extensão: arquivos parecidos ficam na mesma janela do zstd
+                        pending_tar.sort(key=lambda job: (os.path.splitext(job[1])[1], job[1]))
+                        progress.update(task, completed=0, total=len(pending_tar))
+                        for done, (src_file, rel_path) in enumerate(pending_tar, 1):
+                            target.add(src_file, arcname=rel_path, recursive=False)
+                            
+                            now = time.monotonic()
+                            if now - last_update >= PROGRESS_INTERVAL:
+                                progress.update(task, completed=done)
+                                last_update = now
                 
                 # Cria objeto BackupInfo
                 backup_info = BackupInfo(
@@ -242,87 +786,311 @@ class BackupManager:
                     description=description,
                     version="1.0.0",
                     checksum=checksum,
-                    auto_backup=auto
+                    auto_backup=auto,
+                    parent=metadata["parent"],
+                    file_index=file_index
                 )
                 
-                # Atualiza metadados com checksum
-                metadata["checksum"] = checksum
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
-                
-                # Compressa se configurado
-                if self.config.compress_backups:
-                    progress.update(task, description="Comprimindo backup...")
-                    self._compress_backup(backup_path)
-                
                 progress.update(task, description="✅ Backup concluído!")
             
+            self._invalidate_backups_cache()
+            
+            if parent:
+                logger.info(f"Backup incremental sobre {parent.name}: {files_changed} arquivos alterados", extra={"category": "BACKUP"})
             logger.info(f"Backup criado: {name} ({files_copied} arquivos, {total_size // 1024}KB)", extra={"category": "BACKUP"})
             return backup_info
             
         except Exception as e:
             logger.error(f"Erro ao criar backup: {e}", extra={"category": "BACKUP"})
+            self._invalidate_backups_cache()
             # Limpa backup parcial
-            if backup_path.exists():
+            if backup_path.is_dir():
                 shutil.rmtree(backup_path)
+            elif backup_path.exists():
+                backup_path.unlink()
             raise
     
-    def _calculate_checksum(self, backup_path: Path) -> str:
-        """Calcula checksum do backup"""
-        hasher = hashlib.md5()
+    def _backup_file(self, src_file: Union[str, Path], rel_path: str, target, deduplicate: bool,
+                     parent_index: Dict) -> Tuple[str, Tuple[int, int, str], Optional[List[str]], bool]:
+        """Copia um arquivo para o backup (diretório ou ZIP) ou, com deduplicação, grava seus chunks
         
-        for file_path in sorted(backup_path.rglob("*")):
-            if file_path.is_file():
-                with open(file_path, 'rb') as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hasher.update(chunk)
+        Retorna (rel_path, entrada do índice, hashes dos chunks, alterado); o arquivo
+        não é copiado quando não mudou em relação ao backup pai. O hash é calculado
+        antes da cópia, porque decide se ela acontece: arquivos copiados são lidos
+        duas vezes (no diretório a segunda leitura fica no kernel, via _fast_copy).
+        """
+        st = os.stat(src_file)
+        previous = parent_index.get(rel_path)
+        if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+            return rel_path, previous, None, False
         
-        return hasher.hexdigest()
+        entry = (st.st_size, st.st_mtime_ns, self._hash_file(src_file).hex())
+        if previous and previous[2] == entry[2]:
+            return rel_path, entry, None, False
+        
+        if deduplicate:
+            return rel_path, entry, self._store_chunks(src_file), True
+        
+        if isinstance(target, zipfile.ZipFile):
+            compress_type = zipfile.ZIP_STORED if entry[0] < ZIP_STORE_THRESHOLD else zipfile.ZIP_DEFLATED
+            with self._zip_lock:
+                target.write(src_file, rel_path, compress_type=compress_type)
+        elif isinstance(target, tarfile.TarFile):
+            pass  # O stream tar é gravado em sequência por create_backup
+        else:
+            _fast_copy(src_file, target / rel_path)
+        return rel_path, entry, None, True
+    
+    @staticmethod
+    def _write_backup_member(target, name: str, data: bytes):
+        """Grava um arquivo gerado (metadados, manifesto) no backup: diretório, ZIP ou tar"""
+        if isinstance(target, zipfile.ZipFile):
+            target.writestr(name, data)
+        elif isinstance(target, tarfile.TarFile):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            target.addfile(info, io.BytesIO(data))
+        else:
+            (target / name).write_bytes(data)
+    
+    def _resolve_backup_path(self, backup_name: str) -> Path:
+        """Caminho de um backup pelo nome: diretório ou arquivo ZIP"""
+        backup_path = self.backup_dir / backup_name
+        if not backup_path.exists():
+            for suffix in (TAR_ZST_SUFFIX, ".zip"):
+                archive_path = self.backup_dir / f"{backup_name}{suffix}"
+                if archive_path.exists():
+                    return archive_path
+        return backup_path
     
-    def _compress_backup(self, backup_path: Path):
-        """Comprime backup em arquivo ZIP"""
-        zip_path = backup_path.with_suffix('.zip')
+    def _find_incremental_parent(self) -> Optional[BackupInfo]:
+        """Retorna o backup mais recente para servir de base ao incremental"""
+        backups = {b.name: b for b in self.list_backups()}
+        if not backups:
+            return None
+        
+        latest = max(backups.values(), key=lambda b: b.timestamp)
+        if not latest.file_index:
+            return None  # Backup antigo, sem índice de arquivos
+        
+        # Limita a cadeia para a restauração não depender de muitos backups
+        depth, current = 0, latest
+        while current.parent:
+            depth += 1
+            current = backups.get(current.parent)
+            if current is None or depth >= self.config.max_incremental_chain:
+                return None
+        
+        return latest
+    
+    def _materialize_backup(self, backup_name: str, target_dir: Path):
+        """Reconstrói em target_dir o conteúdo completo de um backup, aplicando a cadeia de pais"""
+        backup_path = self._resolve_backup_path(backup_name)
+        if not backup_path.exists():
+            raise FileNotFoundError(f"Backup '{backup_name}' não encontrado")
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in backup_path.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(backup_path)
-                    zipf.write(file_path, arcname)
+        info = json.loads(self._read_backup_file(backup_path, "backup_info.json") or "{}")
+        parent = info.get("parent")
+        if parent:
+            self._materialize_backup(parent, target_dir)
         
-        # Remove diretório original
-        shutil.rmtree(backup_path)
+        if backup_path.is_dir():
+            shutil.copytree(backup_path, target_dir, dirs_exist_ok=True, copy_function=_fast_copy)
+        elif _is_tar_zst(backup_path):
+            with _read_tar_zst(backup_path) as tar:
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(target_dir, filter="data")
+                else:
+                    tar.extractall(target_dir)
+        else:
+            with _open_zip(backup_path) as zipf:
+                zipf.extractall(target_dir)
         
-        # Renomeia ZIP para nome original
-        zip_path.rename(backup_path)
+        manifest_file = target_dir / MANIFEST_FILE
+        if manifest_file.exists():
+            self._materialize_manifest(manifest_file, target_dir)
+            manifest_file.unlink()
+        
+        # Remove arquivos do pai que não existiam mais neste backup
+        if parent:
+            keep = info.get("file_index", {})
+            for file_path, rel_path in list(_walk_files(target_dir, "")):
+                if rel_path not in keep:
+                    os.unlink(file_path)
+    
+    def _chunk_path(self, chunk_hash: str) -> Path:
+        return self.chunks_dir / chunk_hash[:2] / chunk_hash[2:4] / chunk_hash
+    
+    def _store_chunks(self, file_path: Path) -> List[str]:
+        """Grava no repositório os chunks ainda inexistentes e retorna a lista de hashes"""
+        hashes = []
+        for data in _iter_file_chunks(file_path):
+            chunk_hash = hashlib.sha256(data).hexdigest()
+            chunk_file = self._chunk_path(chunk_hash)
+            if not chunk_file.exists():
+                if chunk_file.parent not in self._chunk_dirs:
+                    chunk_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._chunk_dirs.add(chunk_file.parent)
+                # Nome temporário por thread: o mesmo chunk pode chegar de dois arquivos
+                tmp_file = chunk_file.with_name(f"{chunk_hash}.{threading.get_ident()}.tmp")
+                try:
+                    tmp_file.write_bytes(data)
+                except FileNotFoundError:
+                    # Diretório removido por fora desde que entrou no cache
+                    chunk_file.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_file.write_bytes(data)
+                os.replace(tmp_file, chunk_file)
+            hashes.append(chunk_hash)
+        return hashes
+    
+    def _materialize_manifest(self, manifest_file: Path, target_dir: Path):
+        """Reconstrói em target_dir os arquivos descritos por um manifesto de chunks"""
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        
+        _make_dirs((target_dir / rel_path).parent for rel_path, _ in manifest)
+        for rel_path, hashes in manifest:
+            with open(target_dir / rel_path, 'wb') as out:
+                for chunk_hash in hashes:
+                    out.write(self._chunk_path(chunk_hash).read_bytes())
+    
+    def _referenced_chunks(self) -> set:
+        """Hashes referenciados pelos manifestos dos backups existentes"""
+        referenced = set()
+        for backup_path in self.backup_dir.iterdir():
+            data = self._read_backup_file(backup_path, MANIFEST_FILE)
+            if data:
+                for _, hashes in json.loads(data):
+                    referenced.update(hashes)
+        return referenced
+    
+    def _collect_garbage_chunks(self):
+        """Remove do repositório os chunks que nenhum backup referencia mais"""
+        if not self.chunks_dir.exists():
+            return
+        
+        referenced = self._referenced_chunks()
+        removed = 0
+        touched_dirs = set()
+        for chunk_file, _ in _walk_files(self.chunks_dir, ""):
+            if os.path.basename(chunk_file) not in referenced:
+                os.unlink(chunk_file)
+                touched_dirs.add(os.path.dirname(chunk_file))
+                removed += 1
+        
+        # Remove os diretórios de fan-out (.chunks/xx/yy e .chunks/xx) que ficaram vazios
+        for directory in touched_dirs:
+            for fanout_dir in (directory, os.path.dirname(directory)):
+                try:
+                    os.rmdir(fanout_dir)
+                except OSError:
+                    break  # Ainda há chunks nele
+        if touched_dirs:
+            self._chunk_dirs.clear()
+        
+        if removed:
+            logger.info(f"Chunks órfãos removidos: {removed}")
+    
+    @staticmethod
+    def _read_backup_file(backup_path: Path, name: str) -> Optional[bytes]:
+        """Lê um arquivo de um backup, seja diretório, ZIP ou tar.zst"""
+        if backup_path.is_dir():
+            file_path = backup_path / name
+            return file_path.read_bytes() if file_path.is_file() else None
+        
+        if _is_tar_zst(backup_path):
+            with _read_tar_zst(backup_path) as tar:
+                for member in tar:
+                    if member.name == name:
+                        return tar.extractfile(member).read()
+                    if member.name == "backup_info.json":
+                        break  # Arquivos gerados vêm antes dos dados; não há por que descomprimir o resto
+            return None
+        
+        if backup_path.is_file() and zipfile.is_zipfile(backup_path):
+            with _open_zip(backup_path) as zipf:
+                try:
+                    return zipf.read(name)
+                except KeyError:
+                    return None
+        
+        return None
+    
+    @staticmethod
+    def _calculate_checksum(digests: List[Tuple[str, str]]) -> str:
+        """Calcula checksum do backup
+        
+        Combina, em ordem de caminho, o caminho relativo e o digest de cada
+        arquivo gravado. Os digests são os que _backup_file já calcula para o
+        índice incremental: o checksum não relê os arquivos, mas cada arquivo
+        gravado continua sendo lido uma vez para o hash e outra para a cópia.
+        """
+        hasher = _new_hasher()
+        for rel_path, digest in sorted(digests):
+            hasher.update(rel_path.encode("utf-8"))
+            hasher.update(bytes.fromhex(digest))
+        
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def _hash_file(file_path: Union[str, Path]) -> bytes:
+        """Calcula o digest de um arquivo lendo blocos de 1 MiB"""
+        size = os.stat(file_path).st_size
+        if BLAKE3_AVAILABLE and size > MMAP_HASH_THRESHOLD:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.digest()
+        
+        if _uring_enabled() and size > URING_BLOCK_SIZE:
+            # Vários blocos lidos em paralelo pelo io_uring, hasheados em ordem
+            digest = _uring_hash(file_path, size)
+            if digest is not None:
+                return digest
+        
+        hasher = _new_hasher()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        return hasher.digest()
     
     def list_backups(self) -> List[BackupInfo]:
         """Lista todos os backups disponíveis"""
+        mtime = self.backup_dir.stat().st_mtime_ns
+        if self._backups_cache is not None and self._backups_cache_mtime == mtime:
+            return list(self._backups_cache)
+        
         backups = []
         
         for backup_path in self.backup_dir.iterdir():
-            if backup_path.is_dir():
-                # Backup não comprimido
-                info_file = backup_path / "backup_info.json"
-            elif backup_path.suffix == '.zip':
-                # Backup comprimido
-                info_file = backup_path.with_suffix('') / "backup_info.json"
-            else:
+            # Entradas ocultas são internas (.chunks, áreas temporárias .restore_*)
+            if backup_path.name.startswith("."):
                 continue
-            
-            if info_file.exists():
-                try:
-                    with open(info_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        # Remove campos não suportados pelo BackupInfo
-                        data_clean = {k: v for k, v in data.items() if k in ['name', 'timestamp', 'size', 'files_count', 'description', 'version', 'checksum', 'auto_backup']}
-                        backup_info = BackupInfo(**data_clean)
-                        backups.append(backup_info)
-                except Exception as e:
-                    logger.warning(f"Erro ao ler backup {backup_path}: {e}")
+            # Diretório, ZIP ou tar.zst; outras entradas não têm metadados
+            try:
+                raw = self._read_backup_file(backup_path, "backup_info.json")
+                if raw is None:
+                    continue
+                
+                # Campos extras (ex.: config) são ignorados; entradas do índice ficam como listas
+                data = loads_json(raw)
+                backup_info = BackupInfo(*(data.get(k) for k in _BACKUP_INFO_FIELDS))
+                if backup_info.file_index is None:
+                    backup_info.file_index = {}
+                backups.append(backup_info)
+            except Exception as e:
+                logger.warning(f"Erro ao ler backup {backup_path}: {e}")
         
         # Ordena por timestamp
         backups.sort(key=lambda x: x.timestamp, reverse=True)
-        return backups
+        
+        self._backups_cache = backups
+        self._backups_cache_mtime = mtime
+        return list(backups)
+    
+    def _invalidate_backups_cache(self):
+        """Descarta o cache de list_backups (o conteúdo de um backup muda sem alterar o mtime de backups/)"""
+        self._backups_cache = None
     
     def restore_backup(self, backup_name: str, confirm: bool = False) -> bool:
         """Restaura um backup"""
@@ -331,7 +1099,7 @@ class BackupManager:
                 console.print("❌ Restauração cancelada")
                 return False
         
-        backup_path = self.backup_dir / backup_name
+        backup_path = self._resolve_backup_path(backup_name)
         
         if not backup_path.exists():
             console.print(f"❌ Backup '{backup_name}' não encontrado")
@@ -340,54 +1108,26 @@ class BackupManager:
         console.print(f"🔄 [bold yellow]Restaurando backup: {backup_name}[/bold yellow]")
         
         try:
-            # Verifica se é comprimido
-            if backup_path.suffix == '.zip':
-                # Extrai ZIP temporariamente
-                temp_path = backup_path.with_suffix('')
-                with zipfile.ZipFile(backup_path, 'r') as zipf:
-                    zipf.extractall(temp_path)
-                restore_path = temp_path
-            else:
-                restore_path = backup_path
+            info = json.loads(self._read_backup_file(backup_path, "backup_info.json") or "{}")
             
-            # Restaura arquivos
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                console=console
-            ) as progress:
-                
-                task = progress.add_task("Restaurando arquivos...", total=None)
-                
-                for item in self.backup_items:
-                    if not item.get("include", True):
-                        continue
-                    
-                    source_path = restore_path / item["path"]
-                    if not source_path.exists():
-                        continue
-                    
-                    progress.update(task, description=f"Restaurando {item['description']}...")
-                    
-                    dest_path = self.base_dir / item["path"]
-                    
-                    if source_path.is_file():
-                        # Arquivo único
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(source_path, dest_path)
-                        
-                    elif source_path.is_dir():
-                        # Diretório
-                        if dest_path.exists():
-                            shutil.rmtree(dest_path)
-                        shutil.copytree(source_path, dest_path)
-                
-                progress.update(task, description="✅ Restauração concluída!")
+            # Backups comprimidos, incrementais e deduplicados são reconstruídos em área temporária
+            staging_path = None
+            if backup_path.is_dir() and not info.get("parent") and not info.get("config", {}).get("deduplicate"):
+                restore_path = backup_path
+            else:
+                staging_path = self.backup_dir / f".restore_{backup_name}"
+                if staging_path.exists():
+                    shutil.rmtree(staging_path)
+                restore_path = staging_path
             
-            # Limpa arquivos temporários
-            if backup_path.suffix == '.zip' and restore_path.exists():
-                shutil.rmtree(restore_path)
+            try:
+                if staging_path:
+                    self._materialize_backup(backup_name, staging_path)
+                self._restore_items(restore_path)
+            finally:
+                # Limpa a área temporária mesmo se a restauração falhar
+                if staging_path and staging_path.exists():
+                    shutil.rmtree(staging_path, ignore_errors=True)
             
             logger.info(f"Backup restaurado: {backup_name}")
             return True
@@ -397,6 +1137,43 @@ class BackupManager:
             console.print(f"❌ Erro na restauração: {e}")
             return False
     
+    def _restore_items(self, restore_path: Path):
+        """Copia os itens de backup de restore_path de volta para o projeto"""
+        # Restaura arquivos
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            console=console
+        ) as progress:
+            
+            task = progress.add_task("Restaurando arquivos...", total=None)
+            
+            for item in self.backup_items:
+                if not item.get("include", True):
+                    continue
+                
+                source_path = restore_path / item["path"]
+                if not source_path.exists():
+                    continue
+                
+                progress.update(task, description=f"Restaurando {item['description']}...")
+                
+                dest_path = self.base_dir / item["path"]
+                
+                if source_path.is_file():
+                    # Arquivo único
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    _fast_copy(source_path, dest_path)
+                    
+                elif source_path.is_dir():
+                    # Diretório
+                    if dest_path.exists():
+                        shutil.rmtree(dest_path)
+                    shutil.copytree(source_path, dest_path, copy_function=_fast_copy)
+            
+            progress.update(task, description="✅ Restauração concluída!")
+    
     def delete_backup(self, backup_name: str, confirm: bool = False) -> bool:
         """Remove um backup"""
         if not confirm:
@@ -404,17 +1181,22 @@ class BackupManager:
                 console.print("❌ Exclusão cancelada")
                 return False
         
-        backup_path = self.backup_dir / backup_name
+        backup_path = self._resolve_backup_path(backup_name)
         
         if not backup_path.exists():
             console.print(f"❌ Backup '{backup_name}' não encontrado")
             return False
         
+        dependents = [b.name for b in self.list_backups() if b.parent == backup_name]
+        if dependents:
+            console.print(f"❌ Backup '{backup_name}' é base dos incrementais: {', '.join(dependents)}")
+            return False
+        
         try:
-            if backup_path.is_dir():
-                shutil.rmtree(backup_path)
-            else:
-                backup_path.unlink()
+            self._delete_backup_unsafe(backup_path)
+            
+            self._invalidate_backups_cache()
+            self._collect_garbage_chunks()
             
             logger.info(f"Backup deletado: {backup_name}")
             console.print(f"✅ Backup '{backup_name}' deletado")
@@ -425,21 +1207,49 @@ class BackupManager:
             console.print(f"❌ Erro ao deletar: {e}")
             return False
     
+    @staticmethod
+    def _delete_backup_unsafe(backup_path: Path):
+        """Remove os arquivos de um backup, sem confirmação nem checagem de dependências"""
+        if backup_path.is_dir():
+            shutil.rmtree(backup_path)
+        else:
+            backup_path.unlink()
+    
     def cleanup_old_backups(self):
         """Remove backups antigos baseado na configuração"""
         if not self.config.enabled:
             return
         
         backups = self.list_backups()
+        to_remove = []
         
         # Remove backups automáticos antigos
         auto_backups = [b for b in backups if b.auto_backup]
         if len(auto_backups) > self.config.max_backups:
             to_remove = auto_backups[self.config.max_backups:]
-            for backup in to_remove:
-                self.delete_backup(backup.name, confirm=True)
+            
+            # Preserva a cadeia de pais dos backups incrementais que continuam
+            by_name = {b.name: b for b in backups}
+            removing = {b.name for b in to_remove}
+            protected = set()
+            for backup in backups:
+                if backup.name in removing:
+                    continue
+                parent = backup.parent
+                while parent and parent not in protected:
+                    protected.add(parent)
+                    parent = by_name[parent].parent if parent in by_name else None
+            to_remove = [b for b in to_remove if b.name not in protected]
         
-        logger.info(f"Limpeza de backups: {len(to_remove) if 'to_remove' in locals() else 0} removidos")
+        if to_remove:
+            paths = [self._resolve_backup_path(b.name) for b in to_remove]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(self._delete_backup_unsafe, paths))
+            
+            self._invalidate_backups_cache()
+            self._collect_garbage_chunks()
+        
+        logger.info(f"Limpeza de backups: {len(to_remove)} removidos")
     
     def start_auto_backup(self):
         """Inicia backup automático em thread separada"""
@@ -459,12 +1269,32 @@ class BackupManager:
     def stop_auto_backup(self):
         """Para backup automático"""
         if self._backup_thread:
+            # O evento interrompe a cópia em andamento; o cancelamento encerra a espera
             self._stop_backup_thread.set()
+            loop, task = self._backup_loop, self._backup_task
+            if loop and task:
+                try:
+                    loop.call_soon_threadsafe(task.cancel)
+                except RuntimeError:
+                    pass  # Loop já encerrado
             self._backup_thread.join(timeout=5)
             logger.info("Backup automático parado")
     
     def _auto_backup_loop(self):
+        """Thread do backup automático: executa o loop asyncio"""
+        try:
+            asyncio.run(self._auto_backup_loop_async())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._backup_loop = None
+            self._backup_task = None
+    
+    async def _auto_backup_loop_async(self):
         """Loop de backup automático"""
+        self._backup_loop = asyncio.get_running_loop()
+        self._backup_task = asyncio.current_task()
+        
         while not self._stop_backup_thread.is_set():
             try:
                 # Cria backup automático
@@ -472,18 +1302,23 @@ class BackupManager:
                 name = f"auto_backup_{timestamp}"
                 description = f"Backup automático - {datetime.now().strftime('%d/%m/%Y %H:%M')}"
                 
-                self.create_backup(name, description, auto=True)
+                await asyncio.to_thread(self.create_backup, name, description, True,
+                                        self.config.incremental_auto_backup)
                 
                 # Limpa backups antigos
-                self.cleanup_old_backups()
+                await asyncio.to_thread(self.cleanup_old_backups)
                 
                 # Aguarda próximo backup
-                self._stop_backup_thread.wait(self.config.auto_backup_interval * 3600)
+                await asyncio.sleep(self.config.auto_backup_interval * 3600)
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
+                if self._stop_backup_thread.is_set():
+                    break
                 logger.error(f"Erro no backup automático: {e}")
                 # Aguarda 1 hora antes de tentar novamente
-                self._stop_backup_thread.wait(3600)
+                await asyncio.sleep(3600)
     
     def show_backup_status(self):
         """Mostra status dos backups"""
@@ -144,3 +144,34 @@ ADVANCED_CONFIG = {
         "click_through": False
     }
 }
+
+# ==========================================
+# CONFIGURAÇÃO PADRÃO DE LOGS
+# ==========================================
+
+DEFAULT_LOGGING_CONFIG = {
+    "level": "INFO",
+    "max_file_size": "10MB",
+    "retention_days": 30,
+    "enable_console": True,
+    "enable_file": True,
+    "enable_analysis": True,
+    "enable_performance_logging": True,
+    "categories": {
+        "SYSTEM": {"level": "INFO", "enabled": True},
+        "AUDIO": {"level": "DEBUG", "enabled": True},
+        "SPEECH": {"level": "INFO", "enabled": True},
+        "AI": {"level": "DEBUG", "enabled": True},
+        "UI": {"level": "INFO", "enabled": True},
+        "BACKUP": {"level": "INFO", "enabled": True},
+        "CONFIG": {"level": "DEBUG", "enabled": True},
+        "ERROR": {"level": "ERROR", "enabled": True},
+        "PERFORMANCE": {"level": "INFO", "enabled": True},
+        "USER": {"level": "INFO", "enabled": True}
+    },
+    "formats": {
+        "console": "{time:HH:mm:ss} | {level: <8} | {category: <12} | {message}",
+        "file": "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {category: <12} | {module}:{function}:{line} | {message}",
+        "json": "{time:YYYY-MM-DD HH:mm:ss} | {level} | {category} | {module}:{function}:{line} | {message} | {extra_data}"
+    }
+}
@@ -8,16 +8,144 @@ Interface moderna para configuração do sistema
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import json
+import os
+import functools
+import platform
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from rich.console import Console
 
+from json_utils import dumps_json, loads_json
+
 console = Console()
 
+# Caracteres lidos do widget de texto por vez ao exportar o relatório
+EXPORT_CHUNK_CHARS = 1000
+
+CONFIG_NAMES = (
+    "system_config",
+    "backup_config",
+    "logging_config",
+    "dependency_monitor_config",
+)
+
+# Cache de configurações já parseadas: path -> (st_mtime_ns, dados)
+_CONFIG_CACHE: Dict[Path, Tuple[int, Any]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+def _load_json_cached(path: Path):
+    """Carrega JSON, reaproveitando o parse anterior se o mtime não mudou"""
+    mtime = path.stat().st_mtime_ns
+    with _CONFIG_CACHE_LOCK:
+        hit = _CONFIG_CACHE.get(path)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    data = loads_json(path.read_bytes())
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[path] = (mtime, data)
+    return data
+
+def _atomic_write(path: Path, data: bytes):
+    """Grava via arquivo temporário + os.replace (sem arquivo truncado em caso de falha)"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _fsync_dir(directory: Path):
+    """Persiste as renomeações do diretório (não suportado no Windows)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _scan_config_dir(directory: Path) -> Set[str]:
+    """Nomes dos arquivos .json presentes no diretório (uma única passada com scandir)"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.name.endswith(".json") and entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+def _load_config_file(path: Path) -> Dict[str, Any]:
+    """Carrega um arquivo de configuração ({} se ausente ou inválido)"""
+    try:
+        return _load_json_cached(path)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        console.print(f"[yellow]⚠️ Erro ao carregar {path.name}: {e}[/yellow]")
+        return {}
+
+def _invalidate_config_cache(path: Path):
+    """Remove arquivo do cache após escrita"""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.pop(path, None)
+
+@functools.lru_cache(maxsize=None)
+def _default_config_blob(name: str) -> bytes:
+    """Configuração padrão serializada (uma vez por processo)
+    
+    Os padrões vêm dos módulos donos de cada configuração, importados só aqui:
+    carregá-los na importação da GUI traria seus efeitos colaterais.
+    """
+    if name == "backup_config":
+        from backup_manager import BackupConfig
+        return dumps_json(asdict(BackupConfig()))
+    if name == "logging_config":
+        from config import DEFAULT_LOGGING_CONFIG
+        return dumps_json(DEFAULT_LOGGING_CONFIG)
+    if name == "dependency_monitor_config":
+        from dependency_monitor import DEFAULT_MONITOR_CONFIG
+        return dumps_json(DEFAULT_MONITOR_CONFIG)
+    return dumps_json({
+        "version": "1.0.0",
+        "last_setup": None,
+        "python_version": None,
+        "platform": platform.system(),
+        "architecture": platform.machine(),
+        "dependencies_installed": [],
+        "backup_enabled": True,
+        "auto_update": True,
+        "log_level": "INFO",
+    })
+
+# Modelo do relatório de status (apenas os campos dinâmicos são substituídos)
+_STATUS_TMPL = """
+Sales Agent IA - Status do Sistema
+==================================
+
+Data/Hora: {ts}
+
+Configurações:
+- Sistema: {sys}
+- Backup: {bkp}
+- Logs: {log}
+- Dependências: {dep}
+
+Status dos Componentes:
+- Setup Avançado: ✅ Ativo
+- Backup Manager: ✅ Ativo
+- Sistema de Logs: ✅ Ativo
+- Monitor de Dependências: ✅ Ativo
+- Interface Gráfica: ✅ Ativo
+
+Recomendações:
+- Verifique as configurações de backup
+- Monitore os logs regularmente
+- Mantenha as dependências atualizadas
+        """
+
 class ConfigGUI:
     """Interface gráfica para configurações"""
     
@@ -27,39 +155,78 @@ class ConfigGUI:
         self.root.geometry("800x600")
         self.root.configure(bg='#2d3748')
         
+        # Estilos compartilhados, registrados uma única vez
+        self.style = ttk.Style(self.root)
+        self.style.configure('Config.TButton', padding=2)
+        
         # Carrega configurações
         self.config_dir = Path(__file__).parent / "config"
         self.config_dir.mkdir(exist_ok=True)
         
-        self.configs = self._load_all_configs()
+        # Configurações são carregadas sob demanda, na primeira ativação da aba
+        self.configs: Dict[str, Any] = {}
+        self._configs_lock = threading.Lock()
         
-        # Cria interface
-        self._create_interface()
+        # Arquivos de configuração presentes no último scandir
+        self._present_configs: Set[str] = set()
         
-        # Atualiza status
-        self._update_status()
-    
-    def _load_all_configs(self) -> Dict[str, Any]:
-        """Carrega todas as configurações"""
-        configs = {}
+        # Configurações alteradas na interface e ainda não salvas
+        self._dirty: Set[str] = set()
         
-        config_files = [
-            "system_config.json",
-            "backup_config.json", 
-            "logging_config.json",
-            "dependency_monitor_config.json"
-        ]
+        # Campos de cada configuração: nome -> [(chave no JSON, variável, fator), ...]
+        self._form_fields: Dict[str, List[Tuple[str, tk.Variable, int]]] = {}
         
-        for config_file in config_files:
-            config_path = self.config_dir / config_file
-            if config_path.exists():
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        configs[config_file.replace('.json', '')] = json.load(f)
-                except Exception as e:
-                    console.print(f"[yellow]⚠️ Erro ao carregar {config_file}: {e}[/yellow]")
+        # Abas são construídas na primeira ativação (id do frame -> construtor)
+        self._tab_builders: Dict[str, Any] = {}
+        
+        # Cria interface
+        self._create_interface()
         
-        return configs
+        # Pré-carrega as configurações em segundo plano, sem bloquear a UI
+        threading.Thread(target=self._bg_load_configs, daemon=True).start()
+    
+    def _get_config(self, name: str) -> Dict[str, Any]:
+        """Retorna configuração, lendo o arquivo apenas no primeiro acesso"""
+        with self._configs_lock:
+            config = self.configs.get(name)
+        if config is None:
+            config = _load_config_file(self.config_dir / f"{name}.json")
+            with self._configs_lock:
+                config = self.configs.setdefault(name, config)
+        return config
+    
+    def _bg_load_configs(self):
+        """Pré-carrega as configurações ainda não lidas, em paralelo (fora da thread da UI)"""
+        with self._configs_lock:
+            names = [name for name in CONFIG_NAMES if name not in self.configs]
+        if not names:
+            return
+        self._present_configs = _scan_config_dir(self.config_dir)
+        results = {name: {} for name in names if f"{name}.json" not in self._present_configs}
+        names = [name for name in names if name not in results]
+        if names:
+            paths = [self.config_dir / f"{name}.json" for name in names]
+            # Pool transitório: não mantém threads vivas durante o mainloop
+            with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+                results.update(zip(names, executor.map(_load_config_file, paths)))
+        try:
+            self.root.after(0, self._on_configs_ready, results)
+        except (RuntimeError, tk.TclError):
+            # Janela já foi fechada
+            pass
+    
+    def _on_configs_ready(self, results: Dict[str, Dict[str, Any]]):
+        """Incorpora as configurações pré-carregadas (executa na thread da UI)"""
+        with self._configs_lock:
+            for name, config in results.items():
+                self.configs.setdefault(name, config)
+    
+    def _ensure_tab_built(self, event=None):
+        """Constrói a aba selecionada na primeira vez que ela é ativada"""
+        frame_id = self.notebook.select()
+        builder = self._tab_builders.pop(frame_id, None)
+        if builder:
+            builder(self.notebook.nametowidget(frame_id))
     
     def _create_interface(self):
         """Cria interface principal"""
@@ -67,212 +234,183 @@ class ConfigGUI:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Aba Sistema
-        self._create_system_tab()
-        
-        # Aba Backup
-        self._create_backup_tab()
-        
-        # Aba Logs
-        self._create_logs_tab()
-        
-        # Aba Dependências
-        self._create_dependencies_tab()
-        
-        # Aba Status
-        self._create_status_tab()
+        # Abas vazias; o conteúdo é criado sob demanda
+        tabs = [
+            ("Sistema", self._create_system_tab),
+            ("Backup", self._create_backup_tab),
+            ("Logs", self._create_logs_tab),
+            ("Dependências", self._create_dependencies_tab),
+            ("Status", self._create_status_tab),
+        ]
+        for text, builder in tabs:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = builder
         
         # Botões principais
         self._create_action_buttons()
+        
+        # Constrói cada aba ao ser ativada; a aba inicial é construída agora
+        self.notebook.bind("<<NotebookTabChanged>>", self._ensure_tab_built)
+        self._ensure_tab_built()
+    
+    # Especificação das abas: (título do grupo, [(rótulo, tipo, variável/método, opções), ...])
+    # "key" liga o campo a uma chave do JSON da aba ("factor": valor salvo = campo * factor);
+    # campos sem "key" não são carregados nem salvos
+    SYSTEM_SPEC = [
+        ("OpenAI", [
+            ("API Key:", "entry", "openai_key_var",
+             {"width": 50, "show": "*", "widget": "openai_key_entry", "button": ("Testar", "_test_openai")}),
+        ]),
+        ("Áudio", [
+            ("Dispositivo:", "combo", "audio_device_var",
+             {"width": 30, "widget": "audio_device_combo", "button": ("Detectar", "_detect_audio_devices")}),
+        ]),
+        ("Interface", [
+            ("Posição do overlay:", "combo", "overlay_pos_var",
+             {"default": "top-right", "values": ["top-left", "top-right", "bottom-left", "bottom-right"]}),
+            ("Transparência:", "scale", "opacity_var", {"default": 0.9, "from_": 0.1, "to": 1.0}),
+        ]),
+    ]
+    
+    BACKUP_SPEC = [
+        ("Configurações Gerais", [
+            ("Backup automático habilitado", "check", "backup_enabled_var", {"key": "enabled"}),
+            ("Intervalo (horas):", "spin", "backup_interval_var", {"key": "auto_backup_interval", "default": 24, "from_": 1, "to": 168}),
+            ("Máximo de backups:", "spin", "max_backups_var", {"key": "max_backups", "default": 10, "from_": 1, "to": 100}),
+        ]),
+        ("Conteúdo do Backup", [
+            ("Incluir logs", "check", "include_logs_var", {"key": "include_logs"}),
+            ("Incluir arquivos temporários", "check", "include_temp_var", {"key": "include_temp"}),
+            ("Comprimir backups", "check", "compress_backups_var", {"key": "compress_backups", "default": True}),
+        ]),
+        ("Ações", [
+            ("Criar Backup Agora", "button", "_create_backup_now", {}),
+            ("Listar Backups", "button", "_list_backups", {}),
+            ("Limpar Backups Antigos", "button", "_cleanup_backups", {}),
+        ]),
+    ]
+    
+    LOGS_SPEC = [
+        ("Configurações Gerais", [
+            ("Nível de log:", "combo", "log_level_var",
+             {"key": "level", "default": "INFO", "values": ["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]}),
+            ("Tamanho máximo do arquivo:", "combo", "max_file_size_var",
+             {"key": "max_file_size", "default": "10MB", "values": ["1MB", "5MB", "10MB", "50MB", "100MB"]}),
+            ("Retenção (dias):", "spin", "retention_days_var", {"key": "retention_days", "default": 30, "from_": 1, "to": 365}),
+        ]),
+        ("Saída de Logs", [
+            ("Habilitar console", "check", "enable_console_var", {"key": "enable_console", "default": True}),
+            ("Habilitar arquivo", "check", "enable_file_var", {"key": "enable_file", "default": True}),
+            ("Habilitar análise", "check", "enable_analysis_var", {"key": "enable_analysis", "default": True}),
+        ]),
+        ("Ações", [
+            ("Ver Dashboard", "button", "_show_log_dashboard", {}),
+            ("Exportar Logs", "button", "_export_logs", {}),
+            ("Limpar Logs Antigos", "button", "_cleanup_logs", {}),
+        ]),
+    ]
+    
+    DEPENDENCIES_SPEC = [
+        ("Monitor de Dependências", [
+            ("Monitoramento habilitado", "check", "deps_enabled_var", {"key": "enabled", "default": True}),
+            ("Intervalo de verificação (minutos):", "spin", "deps_interval_var",
+             {"key": "check_interval", "factor": 60, "default": 5, "from_": 1, "to": 60}),
+            ("Atualização automática", "check", "auto_update_var", {"key": "auto_update"}),
+            ("Notificar sobre problemas", "check", "notify_issues_var", {"key": "notify_on_issues", "default": True}),
+        ]),
+        ("Ações", [
+            ("Verificar Todas", "button", "_check_all_dependencies", {}),
+            ("Mostrar Status", "button", "_show_deps_status", {}),
+            ("Instalar Faltantes", "button", "_install_missing", {}),
+        ]),
+    ]
+    
+    _VAR_TYPES = {
+        "entry": tk.StringVar,
+        "combo": tk.StringVar,
+        "scale": tk.DoubleVar,
+        "spin": tk.IntVar,
+        "check": tk.BooleanVar,
+    }
     
-    def _create_system_tab(self):
+    def _build_form(self, frame, spec, config_name: str):
+        """Cria os grupos e campos de uma aba a partir da especificação"""
+        for title, rows in spec:
+            group = ttk.LabelFrame(frame, text=title, style='Config.TLabelframe', padding=10)
+            group.pack(fill='x', padx=10, pady=5)
+            button_col = 0
+            
+            for row, (label, kind, name, opts) in enumerate(rows):
+                if kind == "button":
+                    # Botões de ação ficam lado a lado na primeira linha
+                    ttk.Button(group, style='Config.TButton', text=label, command=getattr(self, name)).grid(
+                        row=0, column=button_col, padx=(0, 10))
+                    button_col += 1
+                    continue
+                
+                var = self._VAR_TYPES[kind]()
+                if "default" in opts:
+                    var.set(opts["default"])
+                if "key" in opts:
+                    self._form_fields.setdefault(config_name, []).append((opts["key"], var, opts.get("factor", 1)))
+                    # Alterações marcam a configuração para salvamento
+                    var.trace_add('write', lambda *_, n=config_name: self._dirty.add(n))
+                setattr(self, name, var)
+                
+                if kind == "check":
+                    ttk.Checkbutton(group, text=label, variable=var).grid(row=row, column=0, sticky='w', pady=2)
+                    continue
+                
+                ttk.Label(group, text=label).grid(row=row, column=0, sticky='w', pady=2)
+                if kind == "entry":
+                    widget = ttk.Entry(group, textvariable=var, width=opts.get("width", 30), show=opts.get("show", ""))
+                elif kind == "combo":
+                    widget = ttk.Combobox(group, textvariable=var, values=opts.get("values", ()))
+                    if "width" in opts:
+                        widget.configure(width=opts["width"])
+                elif kind == "scale":
+                    widget = ttk.Scale(group, from_=opts["from_"], to=opts["to"], variable=var, orient='horizontal')
+                else:
+                    widget = ttk.Spinbox(group, from_=opts["from_"], to=opts["to"], textvariable=var, width=10)
+                sticky = 'w' if kind == "spin" else 'ew'
+                widget.grid(row=row, column=1, sticky=sticky, padx=(10, 0), pady=2)
+                if "widget" in opts:
+                    setattr(self, opts["widget"], widget)
+                
+                if "button" in opts:
+                    text, method = opts["button"]
+                    ttk.Button(group, style='Config.TButton', text=text, command=getattr(self, method)).grid(
+                        row=row, column=2, padx=(10, 0), pady=2)
+    
+    def _create_system_tab(self, frame):
         """Cria aba de configurações do sistema"""
-        system_frame = ttk.Frame(self.notebook)
-        self.notebook.add(system_frame, text="Sistema")
-        
-        # Configurações OpenAI
-        openai_frame = ttk.LabelFrame(system_frame, text="OpenAI", padding=10)
-        openai_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(openai_frame, text="API Key:").grid(row=0, column=0, sticky='w', pady=2)
-        self.openai_key_var = tk.StringVar()
-        self.openai_key_entry = ttk.Entry(openai_frame, textvariable=self.openai_key_var, width=50, show="*")
-        self.openai_key_entry.grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=2)
-        
-        ttk.Button(openai_frame, text="Testar", command=self._test_openai).grid(row=0, column=2, padx=(10, 0), pady=2)
-        
-        # Configurações de áudio
-        audio_frame = ttk.LabelFrame(system_frame, text="Áudio", padding=10)
-        audio_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(audio_frame, text="Dispositivo:").grid(row=0, column=0, sticky='w', pady=2)
-        self.audio_device_var = tk.StringVar()
-        self.audio_device_combo = ttk.Combobox(audio_frame, textvariable=self.audio_device_var, width=30)
-        self.audio_device_combo.grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=2)
-        
-        ttk.Button(audio_frame, text="Detectar", command=self._detect_audio_devices).grid(row=0, column=2, padx=(10, 0), pady=2)
-        
-        # Configurações de interface
-        ui_frame = ttk.LabelFrame(system_frame, text="Interface", padding=10)
-        ui_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(ui_frame, text="Posição do overlay:").grid(row=0, column=0, sticky='w', pady=2)
-        self.overlay_pos_var = tk.StringVar(value="top-right")
-        overlay_pos_combo = ttk.Combobox(ui_frame, textvariable=self.overlay_pos_var, 
-                                       values=["top-left", "top-right", "bottom-left", "bottom-right"])
-        overlay_pos_combo.grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=2)
-        
-        ttk.Label(ui_frame, text="Transparência:").grid(row=1, column=0, sticky='w', pady=2)
-        self.opacity_var = tk.DoubleVar(value=0.9)
-        opacity_scale = ttk.Scale(ui_frame, from_=0.1, to=1.0, variable=self.opacity_var, orient='horizontal')
-        opacity_scale.grid(row=1, column=1, sticky='ew', padx=(10, 0), pady=2)
-        
-        # Carrega valores atuais
+        self._build_form(frame, self.SYSTEM_SPEC, "system_config")
         self._load_system_config()
+        self._dirty.discard("system_config")
     
-    def _create_backup_tab(self):
+    def _create_backup_tab(self, frame):
         """Cria aba de configurações de backup"""
-        backup_frame = ttk.Frame(self.notebook)
-        self.notebook.add(backup_frame, text="Backup")
-        
-        # Configurações gerais
-        general_frame = ttk.LabelFrame(backup_frame, text="Configurações Gerais", padding=10)
-        general_frame.pack(fill='x', padx=10, pady=5)
-        
-        self.backup_enabled_var = tk.BooleanVar()
-        ttk.Checkbutton(general_frame, text="Backup automático habilitado", 
-                       variable=self.backup_enabled_var).grid(row=0, column=0, sticky='w', pady=2)
-        
-        ttk.Label(general_frame, text="Intervalo (horas):").grid(row=1, column=0, sticky='w', pady=2)
-        self.backup_interval_var = tk.IntVar(value=24)
-        ttk.Spinbox(general_frame, from_=1, to=168, textvariable=self.backup_interval_var, width=10).grid(row=1, column=1, sticky='w', padx=(10, 0), pady=2)
-        
-        ttk.Label(general_frame, text="Máximo de backups:").grid(row=2, column=0, sticky='w', pady=2)
-        self.max_backups_var = tk.IntVar(value=10)
-        ttk.Spinbox(general_frame, from_=1, to=100, textvariable=self.max_backups_var, width=10).grid(row=2, column=1, sticky='w', padx=(10, 0), pady=2)
-        
-        # Configurações de conteúdo
-        content_frame = ttk.LabelFrame(backup_frame, text="Conteúdo do Backup", padding=10)
-        content_frame.pack(fill='x', padx=10, pady=5)
-        
-        self.include_logs_var = tk.BooleanVar()
-        ttk.Checkbutton(content_frame, text="Incluir logs", 
-                       variable=self.include_logs_var).grid(row=0, column=0, sticky='w', pady=2)
-        
-        self.include_temp_var = tk.BooleanVar()
-        ttk.Checkbutton(content_frame, text="Incluir arquivos temporários", 
-                       variable=self.include_temp_var).grid(row=1, column=0, sticky='w', pady=2)
-        
-        self.compress_backups_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(content_frame, text="Comprimir backups", 
-                       variable=self.compress_backups_var).grid(row=2, column=0, sticky='w', pady=2)
-        
-        # Ações de backup
-        actions_frame = ttk.LabelFrame(backup_frame, text="Ações", padding=10)
-        actions_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(actions_frame, text="Criar Backup Agora", command=self._create_backup_now).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Listar Backups", command=self._list_backups).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Limpar Backups Antigos", command=self._cleanup_backups).pack(side='left')
-        
-        # Carrega valores atuais
+        self._build_form(frame, self.BACKUP_SPEC, "backup_config")
         self._load_backup_config()
+        self._dirty.discard("backup_config")
     
-    def _create_logs_tab(self):
+    def _create_logs_tab(self, frame):
         """Cria aba de configurações de logs"""
-        logs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(logs_frame, text="Logs")
-        
-        # Configurações gerais
-        general_frame = ttk.LabelFrame(logs_frame, text="Configurações Gerais", padding=10)
-        general_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(general_frame, text="Nível de log:").grid(row=0, column=0, sticky='w', pady=2)
-        self.log_level_var = tk.StringVar(value="INFO")
-        log_level_combo = ttk.Combobox(general_frame, textvariable=self.log_level_var,
-                                     values=["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"])
-        log_level_combo.grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=2)
-        
-        ttk.Label(general_frame, text="Tamanho máximo do arquivo:").grid(row=1, column=0, sticky='w', pady=2)
-        self.max_file_size_var = tk.StringVar(value="10MB")
-        max_file_size_combo = ttk.Combobox(general_frame, textvariable=self.max_file_size_var,
-                                         values=["1MB", "5MB", "10MB", "50MB", "100MB"])
-        max_file_size_combo.grid(row=1, column=1, sticky='ew', padx=(10, 0), pady=2)
-        
-        ttk.Label(general_frame, text="Retenção (dias):").grid(row=2, column=0, sticky='w', pady=2)
-        self.retention_days_var = tk.IntVar(value=30)
-        ttk.Spinbox(general_frame, from_=1, to=365, textvariable=self.retention_days_var, width=10).grid(row=2, column=1, sticky='w', padx=(10, 0), pady=2)
-        
-        # Configurações de saída
-        output_frame = ttk.LabelFrame(logs_frame, text="Saída de Logs", padding=10)
-        output_frame.pack(fill='x', padx=10, pady=5)
-        
-        self.enable_console_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(output_frame, text="Habilitar console", 
-                       variable=self.enable_console_var).grid(row=0, column=0, sticky='w', pady=2)
-        
-        self.enable_file_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(output_frame, text="Habilitar arquivo", 
-                       variable=self.enable_file_var).grid(row=1, column=0, sticky='w', pady=2)
-        
-        self.enable_analysis_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(output_frame, text="Habilitar análise", 
-                       variable=self.enable_analysis_var).grid(row=2, column=0, sticky='w', pady=2)
-        
-        # Ações de logs
-        actions_frame = ttk.LabelFrame(logs_frame, text="Ações", padding=10)
-        actions_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(actions_frame, text="Ver Dashboard", command=self._show_log_dashboard).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Exportar Logs", command=self._export_logs).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Limpar Logs Antigos", command=self._cleanup_logs).pack(side='left')
-        
-        # Carrega valores atuais
+        self._build_form(frame, self.LOGS_SPEC, "logging_config")
         self._load_logs_config()
+        self._dirty.discard("logging_config")
     
-    def _create_dependencies_tab(self):
+    def _create_dependencies_tab(self, frame):
         """Cria aba de dependências"""
-        deps_frame = ttk.Frame(self.notebook)
-        self.notebook.add(deps_frame, text="Dependências")
-        
-        # Configurações do monitor
-        monitor_frame = ttk.LabelFrame(deps_frame, text="Monitor de Dependências", padding=10)
-        monitor_frame.pack(fill='x', padx=10, pady=5)
-        
-        self.deps_enabled_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(monitor_frame, text="Monitoramento habilitado", 
-                       variable=self.deps_enabled_var).pack(anchor='w', pady=2)
-        
-        ttk.Label(monitor_frame, text="Intervalo de verificação (minutos):").pack(anchor='w', pady=2)
-        self.deps_interval_var = tk.IntVar(value=5)
-        ttk.Spinbox(monitor_frame, from_=1, to=60, textvariable=self.deps_interval_var, width=10).pack(anchor='w', padx=(0, 0), pady=2)
-        
-        self.auto_update_var = tk.BooleanVar()
-        ttk.Checkbutton(monitor_frame, text="Atualização automática", 
-                       variable=self.auto_update_var).pack(anchor='w', pady=2)
-        
-        self.notify_issues_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(monitor_frame, text="Notificar sobre problemas", 
-                       variable=self.notify_issues_var).pack(anchor='w', pady=2)
-        
-        # Ações de dependências
-        actions_frame = ttk.LabelFrame(deps_frame, text="Ações", padding=10)
-        actions_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(actions_frame, text="Verificar Todas", command=self._check_all_dependencies).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Mostrar Status", command=self._show_deps_status).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Instalar Faltantes", command=self._install_missing).pack(side='left')
-        
-        # Carrega valores atuais
+        self._build_form(frame, self.DEPENDENCIES_SPEC, "dependency_monitor_config")
         self._load_dependencies_config()
+        self._dirty.discard("dependency_monitor_config")
     
-    def _create_status_tab(self):
+    def _create_status_tab(self, status_frame):
         """Cria aba de status do sistema"""
-        status_frame = ttk.Frame(self.notebook)
-        self.notebook.add(status_frame, text="Status")
-        
         # Status geral
-        general_frame = ttk.LabelFrame(status_frame, text="Status Geral", padding=10)
+        general_frame = ttk.LabelFrame(status_frame, text="Status Geral", style='Config.TLabelframe', padding=10)
         general_frame.pack(fill='x', padx=10, pady=5)
         
         self.status_text = tk.Text(general_frame, height=15, width=80, wrap='word')
@@ -286,40 +424,54 @@ class ConfigGUI:
         update_frame = ttk.Frame(status_frame)
         update_frame.pack(fill='x', padx=10, pady=5)
         
-        ttk.Button(update_frame, text="Atualizar Status", command=self._update_status).pack(side='left', padx=(0, 10))
-        ttk.Button(update_frame, text="Exportar Relatório", command=self._export_status_report).pack(side='left')
+        ttk.Button(update_frame, style='Config.TButton', text="Atualizar Status", command=self._update_status).pack(side='left', padx=(0, 10))
+        ttk.Button(update_frame, style='Config.TButton', text="Exportar Relatório", command=self._export_status_report).pack(side='left')
+        
+        # Atualiza status
+        self._update_status()
     
     def _create_action_buttons(self):
         """Cria botões de ação principais"""
         button_frame = ttk.Frame(self.root)
         button_frame.pack(fill='x', padx=10, pady=10)
         
-        ttk.Button(button_frame, text="Salvar Todas as Configurações", 
+        ttk.Button(button_frame, style='Config.TButton', text="Salvar Todas as Configurações", 
                  command=self._save_all_configs).pack(side='left', padx=(0, 10))
-        ttk.Button(button_frame, text="Restaurar Padrões", 
+        ttk.Button(button_frame, style='Config.TButton', text="Restaurar Padrões", 
                  command=self._restore_defaults).pack(side='left', padx=(0, 10))
-        ttk.Button(button_frame, text="Fechar", 
+        ttk.Button(button_frame, style='Config.TButton', text="Fechar", 
                  command=self.root.quit).pack(side='right')
     
     def _load_system_config(self):
         """Carrega configurações do sistema"""
-        # Implementar carregamento das configurações
-        pass
+        self._apply_config("system_config")
     
     def _load_backup_config(self):
         """Carrega configurações de backup"""
-        # Implementar carregamento das configurações
-        pass
+        self._apply_config("backup_config")
     
     def _load_logs_config(self):
         """Carrega configurações de logs"""
-        # Implementar carregamento das configurações
-        pass
+        self._apply_config("logging_config")
     
     def _load_dependencies_config(self):
         """Carrega configurações de dependências"""
-        # Implementar carregamento das configurações
-        pass
+        self._apply_config("dependency_monitor_config")
+    
+    def _apply_config(self, name: str):
+        """Preenche os campos da aba com os valores da configuração"""
+        config = self._get_config(name)
+        for key, var, factor in self._form_fields.get(name, ()):
+            if key in config:
+                var.set(config[key] // factor if factor != 1 else config[key])
+    
+    def _collect_config(self, name: str) -> Dict[str, Any]:
+        """Configuração atual com os valores dos campos da aba (chaves sem campo são mantidas)"""
+        config = dict(self._get_config(name) or loads_json(_default_config_blob(name)))
+        for key, var, factor in self._form_fields.get(name, ()):
+            value = var.get()
+            config[key] = value * factor if factor != 1 else value
+        return config
     
     def _test_openai(self):
         """Testa conexão com OpenAI"""
@@ -370,35 +522,23 @@ class ConfigGUI:
         self.status_text.delete(1.0, tk.END)
         self.status_text.insert(tk.END, "Atualizando status...\n")
         
-        # Simula atualização
-        threading.Timer(1.0, self._populate_status).start()
+        # Agenda no loop do Tk: widgets só podem ser alterados na thread da UI
+        self.root.after(1000, self._populate_status)
     
     def _populate_status(self):
         """Popula status do sistema"""
-        status_info = f"""
-Sales Agent IA - Status do Sistema
-==================================
-
-Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
-
-Configurações:
-- Sistema: {'✅' if 'system_config' in self.configs else '❌'}
-- Backup: {'✅' if 'backup_config' in self.configs else '❌'}
-- Logs: {'✅' if 'logging_config' in self.configs else '❌'}
-- Dependências: {'✅' if 'dependency_monitor_config' in self.configs else '❌'}
-
-Status dos Componentes:
-- Setup Avançado: ✅ Ativo
-- Backup Manager: ✅ Ativo
-- Sistema de Logs: ✅ Ativo
-- Monitor de Dependências: ✅ Ativo
-- Interface Gráfica: ✅ Ativo
-
-Recomendações:
-- Verifique as configurações de backup
-- Monitore os logs regularmente
-- Mantenha as dependências atualizadas
-        """
+        self._present_configs = _scan_config_dir(self.config_dir)
+        
+        def mark(name: str) -> str:
+            return '✅' if f"{name}.json" in self._present_configs else '❌'
+        
+        status_info = _STATUS_TMPL.format_map({
+            'ts': time.strftime('%d/%m/%Y %H:%M:%S'),
+            'sys': mark("system_config"),
+            'bkp': mark("backup_config"),
+            'log': mark("logging_config"),
+            'dep': mark("dependency_monitor_config"),
+        })
         
         self.status_text.delete(1.0, tk.END)
         self.status_text.insert(tk.END, status_info)
@@ -411,19 +551,55 @@ Recomendações:
         )
         
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.status_text.get(1.0, tk.END))
+            # Copia o texto em blocos, sem materializar o buffer inteiro
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                idx = '1.0'
+                while True:
+                    chunk = self.status_text.get(idx, f"{idx}+{EXPORT_CHUNK_CHARS}c")
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    idx = self.status_text.index(f"{idx}+{EXPORT_CHUNK_CHARS}c")
             messagebox.showinfo("Exportação", f"Relatório salvo em: {filename}")
     
     def _save_all_configs(self):
-        """Salva todas as configurações"""
-        # Implementar salvamento das configurações
+        """Salva as configurações alteradas"""
+        if not self._dirty:
+            messagebox.showinfo("Salvamento", "Nenhuma alteração para salvar.")
+            return
+        
+        # Coleta todos os valores antes de gravar: um campo inválido não deixa gravação parcial
+        try:
+            collected = {name: self._collect_config(name) for name in self._dirty}
+        except tk.TclError as e:
+            messagebox.showerror("Salvamento", f"Valor inválido em um dos campos: {e}")
+            return
+        
+        for name, config in collected.items():
+            config_path = self.config_dir / f"{name}.json"
+            _atomic_write(config_path, dumps_json(config))
+            _invalidate_config_cache(config_path)
+            with self._configs_lock:
+                self.configs[name] = config
+        # Um único fsync do diretório para todas as renomeações
+        _fsync_dir(self.config_dir)
+        self._dirty.clear()
         messagebox.showinfo("Salvamento", "Configurações salvas com sucesso!")
     
     def _restore_defaults(self):
         """Restaura configurações padrão"""
         if messagebox.askyesno("Confirmação", "Deseja restaurar as configurações padrão?"):
-            # Implementar restauração
+            for name in CONFIG_NAMES:
+                blob = _default_config_blob(name)
+                config_path = self.config_dir / f"{name}.json"
+                _atomic_write(config_path, blob)
+                _invalidate_config_cache(config_path)
+                with self._configs_lock:
+                    self.configs[name] = loads_json(blob)
+                # Campos das abas já construídas passam a mostrar os padrões
+                self._apply_config(name)
+                self._dirty.discard(name)
+            _fsync_dir(self.config_dir)
             messagebox.showinfo("Restauração", "Configurações restauradas para os padrões!")
     
     def run(self):
@@ -4,31 +4,87 @@
 🔍 SALES AGENT IA - MONITOR DE DEPENDÊNCIAS
 ==========================================
 Sistema de validação e monitoramento de dependências em tempo real
+
+Nota de desempenho: o trabalho deste módulo é I/O (PyPI, importlib.metadata),
+strings e dicionários - não há laços numéricos. Numba/JIT não se aplica aqui
+(suporte limitado a strings e custo de compilação maior que o ganho); as
+otimizações certas são cache e paralelismo de I/O. O monitor não importa
+pacotes pesados (numba, numpy etc.) por conta própria.
 """
 
 import os
 import sys
-import json
+import copy
+import asyncio
 import time
 import threading
+import functools
 import subprocess
 import importlib
-import pkg_resources
+import importlib.metadata
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 
-import requests
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich import box
+
+from json_utils import dumps_json, loads_json
+
+# requests, packaging e o restante do Rich são importados sob demanda:
+# caminhos como --check-one não precisam carregá-los.
+
+# packaging (opcional) - comparação de versões e requisitos
+PACKAGING_AVAILABLE = importlib.util.find_spec("packaging") is not None
+
+# requests-cache (opcional) - cache persistente das consultas ao PyPI
+REQUESTS_CACHE_AVAILABLE = importlib.util.find_spec("requests_cache") is not None
+
+# aiohttp (opcional) - consultas concorrentes ao PyPI no monitoramento em background
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
 
 console = Console()
 
+PYPI_CACHE_EXPIRY = 86400  # 24 horas
+CHECK_WORKERS = 16  # Verificações de dependência em paralelo
+PYPI_ROTATION = 12  # No monitoramento, cada ciclo consulta o PyPI para 1/12 das dependências
+
+# Módulos da biblioteca padrão, resolvidos uma vez (None antes do Python 3.10)
+_STDLIB_MODULES = getattr(sys, "stdlib_module_names", None)
+
+# Marca "versão mais recente ainda não consultada" em check_dependency
+_FETCH_LATEST = object()
+
+# Configuração padrão do monitor (também usada pela interface de configuração)
+DEFAULT_MONITOR_CONFIG = {
+    "enabled": True,
+    "check_interval": 300,  # 5 minutos
+    "auto_update": False,
+    "notify_on_issues": True,
+    "check_pypi": True,
+    "critical_dependencies": [
+        "openai",
+        "pandas",
+        "numpy",
+        "rich",
+        "loguru",
+        "sounddevice",
+        "soundfile",
+        "scipy",
+        "sentence-transformers",
+        "chromadb"
+    ],
+    "optional_dependencies": [
+        "pystray",
+        "PIL",
+        "psutil",
+        "plyer"
+    ]
+}
+
 class DependencyStatus(Enum):
     """Status de dependência"""
     OK = "OK"
@@ -37,7 +93,41 @@ class DependencyStatus(Enum):
     ERROR = "ERROR"
     CHECKING = "CHECKING"
 
-@dataclass
+# __slots__ nas dataclasses (dataclass(slots=True) requer Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Rótulos de status já montados (emoji + valor) para as tabelas
+_STATUS_EMOJI = {
+    DependencyStatus.OK: "✅ OK",
+    DependencyStatus.MISSING: "❌ MISSING",
+    DependencyStatus.OUTDATED: "⚠️ OUTDATED",
+    DependencyStatus.ERROR: "💥 ERROR",
+    DependencyStatus.CHECKING: "🔄 CHECKING"
+}
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class DependencySpec:
+    """Dependência monitorada (dados estáticos)"""
+    name: str
+    version: str
+    critical: bool
+    description: str
+    module: str
+    distribution: Optional[str] = None  # Nome no PyPI, quando difere de name
+    
+    @property
+    def package(self) -> str:
+        """Nome da distribuição no PyPI"""
+        return self.distribution or self.name
+
+# Cor do status geral de saúde
+_HEALTH_COLOR = {
+    "HEALTHY": "green",
+    "WARNING": "yellow",
+    "CRITICAL": "red"
+}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DependencyInfo:
     """Informações de uma dependência"""
     name: str
@@ -51,7 +141,7 @@ class DependencyInfo:
     update_available: bool = False
     latest_version: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemHealth:
     """Saúde geral do sistema"""
     overall_status: str
@@ -74,12 +164,35 @@ class DependencyMonitor:
         # Carrega configuração
         self.config = self._load_monitor_config()
         
-        # Lista de dependências
-        self.dependencies = self._get_dependency_list()
+        # Lista de dependências (requisitos de versão compilados no primeiro uso)
+        self.dependencies: Tuple[DependencySpec, ...] = self._get_dependency_list()
+        self._dep_index = {dep.name: dep for dep in self.dependencies}
+        self._specs: Dict[str, Any] = {}  # nome -> SpecifierSet compilado
         
         # Cache de verificações
         self.dependency_cache: Dict[str, DependencyInfo] = {}
         self.cache_expiry = 300  # 5 minutos
+        self._cache_ts: Dict[str, float] = {}  # time.monotonic() da última verificação
+        self._cache_lock = threading.Lock()
+        
+        # Pool reutilizado entre verificações (consultas ao PyPI são limitadas por I/O)
+        self._check_executor = ThreadPoolExecutor(max_workers=CHECK_WORKERS, thread_name_prefix="dep-check")
+        
+        # Sessão HTTP do PyPI, criada na primeira consulta
+        self._pypi_session = None
+        self._pypi_session_lock = threading.Lock()
+        
+        # Cache em memória das versões mais recentes (falhas de rede não são cacheadas)
+        self._latest_version_cached = functools.lru_cache(maxsize=128)(self._fetch_latest_version)
+        self._latest_version_cache_time = time.monotonic()
+        
+        # Caminho assíncrono (aiohttp): sessão do loop de monitoramento e versões consultadas
+        self._http = None
+        self._latest_version_memo: Dict[str, Tuple[float, Optional[str]]] = {}
+        
+        # Rotação das consultas ao PyPI e hash do último estado notificado
+        self._pypi_tick = 0
+        self._last_state_hash: Optional[int] = None
         
         # Thread de monitoramento
         self._monitor_thread = None
@@ -94,36 +207,11 @@ class DependencyMonitor:
         """Carrega configuração do monitor"""
         config_file = self.config_dir / "dependency_monitor_config.json"
         
-        default_config = {
-            "enabled": True,
-            "check_interval": 300,  # 5 minutos
-            "auto_update": False,
-            "notify_on_issues": True,
-            "check_pypi": True,
-            "critical_dependencies": [
-                "openai",
-                "pandas",
-                "numpy",
-                "rich",
-                "loguru",
-                "sounddevice",
-                "soundfile",
-                "scipy",
-                "sentence-transformers",
-                "chromadb"
-            ],
-            "optional_dependencies": [
-                "pystray",
-                "PIL",
-                "psutil",
-                "plyer"
-            ]
-        }
+        default_config = copy.deepcopy(DEFAULT_MONITOR_CONFIG)
         
         if config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return {**default_config, **json.load(f)}
+                return {**default_config, **loads_json(config_file.read_bytes())}
             except Exception as e:
                 console.print(f"[yellow]⚠️ Erro ao carregar config do monitor: {e}[/yellow]")
                 return default_config
@@ -137,136 +225,137 @@ class DependencyMonitor:
         config_file = self.config_dir / "dependency_monitor_config.json"
         
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            config_file.write_bytes(dumps_json(config))
         except Exception as e:
             console.print(f"[red]❌ Erro ao salvar config do monitor: {e}[/red]")
     
-    def _get_dependency_list(self) -> List[Dict]:
+    def _get_dependency_list(self) -> Tuple[DependencySpec, ...]:
         """Lista todas as dependências do sistema"""
-        return [
-            {
-                "name": "openai",
-                "version": ">=1.0.0",
-                "critical": True,
-                "description": "API da OpenAI para IA",
-                "test_import": "import openai"
-            },
-            {
-                "name": "pandas",
-                "version": ">=1.5.0",
-                "critical": True,
-                "description": "Análise de dados",
-                "test_import": "import pandas"
-            },
-            {
-                "name": "numpy",
-                "version": ">=1.21.0",
-                "critical": True,
-                "description": "Computação numérica",
-                "test_import": "import numpy"
-            },
-            {
-                "name": "rich",
-                "version": ">=13.0.0",
-                "critical": True,
-                "description": "Interface rica no terminal",
-                "test_import": "import rich"
-            },
-            {
-                "name": "loguru",
-                "version": ">=0.7.0",
-                "critical": True,
-                "description": "Sistema de logs avançado",
-                "test_import": "import loguru"
-            },
-            {
-                "name": "sounddevice",
-                "version": ">=0.4.0",
-                "critical": True,
-                "description": "Captura de áudio",
-                "test_import": "import sounddevice"
-            },
-            {
-                "name": "soundfile",
-                "version": ">=0.12.0",
-                "critical": True,
-                "description": "Processamento de arquivos de áudio",
-                "test_import": "import soundfile"
-            },
-            {
-                "name": "scipy",
-                "version": ">=1.9.0",
-                "critical": True,
-                "description": "Processamento científico",
-                "test_import": "import scipy"
-            },
-            {
-                "name": "sentence-transformers",
-                "version": ">=2.2.0",
-                "critical": True,
-                "description": "Modelos de embeddings",
-                "test_import": "import sentence_transformers"
-            },
-            {
-                "name": "chromadb",
-                "version": ">=0.4.0",
-                "critical": True,
-                "description": "Base de dados vetorial",
-                "test_import": "import chromadb"
-            },
-            {
-                "name": "pystray",
-                "version": ">=0.19.0",
-                "critical": False,
-                "description": "System tray interface",
-                "test_import": "import pystray"
-            },
-            {
-                "name": "PIL",
-                "version": ">=9.0.0",
-                "critical": False,
-                "description": "Processamento de imagens",
-                "test_import": "import PIL"
-            },
-            {
-                "name": "python-dotenv",
-                "version": ">=1.0.0",
-                "critical": True,
-                "description": "Gerenciamento de variáveis de ambiente",
-                "test_import": "import dotenv"
-            },
-            {
-                "name": "requests",
-                "version": ">=2.28.0",
-                "critical": True,
-                "description": "Requisições HTTP",
-                "test_import": "import requests"
-            },
-            {
-                "name": "tkinter",
-                "version": "builtin",
-                "critical": False,
-                "description": "Interface gráfica (builtin)",
-                "test_import": "import tkinter"
-            }
-        ]
+        return (
+            DependencySpec(
+                name="openai",
+                version=">=1.0.0",
+                critical=True,
+                description="API da OpenAI para IA",
+                module="openai"
+            ),
+            DependencySpec(
+                name="pandas",
+                version=">=1.5.0",
+                critical=True,
+                description="Análise de dados",
+                module="pandas"
+            ),
+            DependencySpec(
+                name="numpy",
+                version=">=1.21.0",
+                critical=True,
+                description="Computação numérica",
+                module="numpy"
+            ),
+            DependencySpec(
+                name="rich",
+                version=">=13.0.0",
+                critical=True,
+                description="Interface rica no terminal",
+                module="rich"
+            ),
+            DependencySpec(
+                name="loguru",
+                version=">=0.7.0",
+                critical=True,
+                description="Sistema de logs avançado",
+                module="loguru"
+            ),
+            DependencySpec(
+                name="sounddevice",
+                version=">=0.4.0",
+                critical=True,
+                description="Captura de áudio",
+                module="sounddevice"
+            ),
+            DependencySpec(
+                name="soundfile",
+                version=">=0.12.0",
+                critical=True,
+                description="Processamento de arquivos de áudio",
+                module="soundfile"
+            ),
+            DependencySpec(
+                name="scipy",
+                version=">=1.9.0",
+                critical=True,
+                description="Processamento científico",
+                module="scipy"
+            ),
+            DependencySpec(
+                name="sentence-transformers",
+                version=">=2.2.0",
+                critical=True,
+                description="Modelos de embeddings",
+                module="sentence_transformers"
+            ),
+            DependencySpec(
+                name="chromadb",
+                version=">=0.4.0",
+                critical=True,
+                description="Base de dados vetorial",
+                module="chromadb"
+            ),
+            DependencySpec(
+                name="pystray",
+                version=">=0.19.0",
+                critical=False,
+                description="System tray interface",
+                module="pystray"
+            ),
+            DependencySpec(
+                name="PIL",
+                version=">=9.0.0",
+                critical=False,
+                description="Processamento de imagens",
+                module="PIL",
+                distribution="Pillow"
+            ),
+            DependencySpec(
+                name="python-dotenv",
+                version=">=1.0.0",
+                critical=True,
+                description="Gerenciamento de variáveis de ambiente",
+                module="dotenv"
+            ),
+            DependencySpec(
+                name="requests",
+                version=">=2.28.0",
+                critical=True,
+                description="Requisições HTTP",
+                module="requests"
+            ),
+            DependencySpec(
+                name="tkinter",
+                version="builtin",
+                critical=False,
+                description="Interface gráfica (builtin)",
+                module="tkinter"
+            )
+        )
     
-    def check_dependency(self, dep_name: str, force_check: bool = False) -> DependencyInfo:
-        """Verifica status de uma dependência específica"""
-        # Verifica cache
-        if not force_check and dep_name in self.dependency_cache:
-            cached = self.dependency_cache[dep_name]
-            cache_time = datetime.fromisoformat(cached.last_checked)
-            if (datetime.now() - cache_time).seconds < self.cache_expiry:
-                return cached
+    def check_dependency(self, dep_name: str, force_check: bool = False,
+                         latest_version: Optional[str] = _FETCH_LATEST,
+                         sweep_ts: Optional[str] = None) -> DependencyInfo:
+        """Verifica status de uma dependência específica
+        
+        latest_version permite informar a versão do PyPI já consultada (caminho assíncrono);
+        sweep_ts é o horário compartilhado por todas as verificações de uma varredura.
+        """
+        # Verifica cache (last_checked fica só para exibição)
+        if not force_check and time.monotonic() - self._cache_ts.get(dep_name, float("-inf")) < self.cache_expiry:
+            return self.dependency_cache[dep_name]
+        
+        checked_at = sweep_ts or datetime.now().isoformat()
         
         # Busca informações da dependência
-        dep_info = None
-        for dep in self.dependencies:
-            if dep["name"] == dep_name:
-                dep_info = dep
-                break
+        dep_info = self._dep_index.get(dep_name)
         
         if not dep_info:
             return DependencyInfo(
@@ -274,46 +363,45 @@ class DependencyMonitor:
                 version_installed=None,
                 version_required="unknown",
                 status=DependencyStatus.ERROR,
-                last_checked=datetime.now().isoformat(),
+                last_checked=checked_at,
                 error_message="Dependência não encontrada na lista",
                 is_critical=False
             )
         
-        # Verifica se está instalada
+        # Verifica se está instalada (sem importar o módulo)
+        parsed_version = None
         try:
-            if dep_info["version"] == "builtin":
+            if dep_info.version == "builtin":
                 # Dependência builtin do Python
-                exec(dep_info["test_import"])
-                version_installed = "builtin"
-                status = DependencyStatus.OK
-                error_message = None
-            else:
-                # Dependência externa
-                try:
-                    exec(dep_info["test_import"])
-                    # Tenta obter versão
-                    try:
-                        module = importlib.import_module(dep_info["name"])
-                        version_installed = getattr(module, "__version__", "unknown")
-                    except:
-                        # Fallback para pkg_resources
-                        try:
-                            version_installed = pkg_resources.get_distribution(dep_info["name"]).version
-                        except:
-                            version_installed = "installed"
-                    
-                    # Verifica se versão atende requisito
-                    if self._check_version_requirement(version_installed, dep_info["version"]):
-                        status = DependencyStatus.OK
-                    else:
-                        status = DependencyStatus.OUTDATED
-                    
+                if (_STDLIB_MODULES is None or dep_info.module in _STDLIB_MODULES) and importlib.util.find_spec(dep_info.module):
+                    version_installed = "builtin"
+                    status = DependencyStatus.OK
                     error_message = None
-                    
-                except ImportError:
+                else:
                     version_installed = None
                     status = DependencyStatus.MISSING
                     error_message = f"Módulo {dep_name} não encontrado"
+            elif importlib.util.find_spec(dep_info.module) is None:
+                version_installed = None
+                status = DependencyStatus.MISSING
+                error_message = f"Módulo {dep_name} não encontrado"
+            else:
+                # Versão via metadados do pacote, sem carregá-lo
+                try:
+                    version_installed = importlib.metadata.version(dep_info.package)
+                except importlib.metadata.PackageNotFoundError:
+                    version_installed = "installed"
+                
+                # Verifica se versão atende requisito
+                parsed_version = self._parse_version(version_installed)
+                if dep_name not in self._specs:
+                    self._specs[dep_name] = self._compile_specifier(dep_info.version)
+                if self._check_version_requirement(parsed_version, self._specs[dep_name]):
+                    status = DependencyStatus.OK
+                else:
+                    status = DependencyStatus.OUTDATED
+                
+                error_message = None
         
         except Exception as e:
             version_installed = None
@@ -322,13 +410,15 @@ class DependencyMonitor:
         
         # Verifica se há atualização disponível
         update_available = False
-        latest_version = None
         
-        if status == DependencyStatus.OK and self.config.get("check_pypi", True):
+        if status != DependencyStatus.OK or not self.config.get("check_pypi", True):
+            latest_version = None
+        else:
             try:
-                latest_version = self._get_latest_version(dep_name)
+                if latest_version is _FETCH_LATEST:
+                    latest_version = self._get_latest_version(dep_info.package)
                 if latest_version and version_installed != "builtin":
-                    update_available = self._is_newer_version(latest_version, version_installed)
+                    update_available = self._is_newer_version(latest_version, parsed_version)
             except:
                 pass  # Falha silenciosa na verificação de atualização
         
@@ -336,55 +426,126 @@ class DependencyMonitor:
         dependency_info = DependencyInfo(
             name=dep_name,
             version_installed=version_installed,
-            version_required=dep_info["version"],
+            version_required=dep_info.version,
             status=status,
-            last_checked=datetime.now().isoformat(),
+            last_checked=checked_at,
             error_message=error_message,
-            is_critical=dep_info["critical"],
+            is_critical=dep_info.critical,
             auto_update=self.config.get("auto_update", False),
             update_available=update_available,
             latest_version=latest_version
         )
         
         # Atualiza cache
-        self.dependency_cache[dep_name] = dependency_info
+        with self._cache_lock:
+            self.dependency_cache[dep_name] = dependency_info
+            self._cache_ts[dep_name] = time.monotonic()
         
         return dependency_info
     
-    def _check_version_requirement(self, installed: str, required: str) -> bool:
-        """Verifica se versão instalada atende requisito"""
-        if installed == "builtin" or installed == "unknown":
-            return True
-        
+    def _compile_specifier(self, required: str):
+        """Compila requisito de versão (ex.: ">=1.0,<2") em SpecifierSet"""
+        if required == "builtin" or not PACKAGING_AVAILABLE:
+            return None
+        from packaging.specifiers import SpecifierSet, InvalidSpecifier
         try:
-            from packaging import version
-            return version.parse(installed) >= version.parse(required.replace(">=", ""))
-        except:
-            # Fallback simples
+            return SpecifierSet(required)
+        except InvalidSpecifier:
+            return None
+    
+    def _parse_version(self, installed: Optional[str]):
+        """Converte versão instalada em Version (None se não comparável)"""
+        if not PACKAGING_AVAILABLE or installed in (None, "builtin", "unknown", "installed"):
+            return None
+        from packaging.version import Version, InvalidVersion
+        try:
+            return Version(installed)
+        except InvalidVersion:
+            return None
+    
+    def _check_version_requirement(self, installed, spec) -> bool:
+        """Verifica se versão instalada atende requisito"""
+        if installed is None or spec is None:
+            # Sem como comparar: considera atendido
             return True
+        return spec.contains(installed, prereleases=True)
+    
+    def _get_pypi_session(self):
+        """Sessão HTTP do PyPI (cache em disco quando requests-cache está disponível)"""
+        with self._pypi_session_lock:
+            if self._pypi_session is None:
+                if REQUESTS_CACHE_AVAILABLE:
+                    import requests_cache
+                    self._pypi_session = requests_cache.CachedSession(
+                        str(self.config_dir / "pypi_cache"),
+                        backend="sqlite",
+                        expire_after=PYPI_CACHE_EXPIRY,
+                        allowable_codes=(200, 404)
+                    )
+                else:
+                    import requests
+                    self._pypi_session = requests.Session()
+            return self._pypi_session
+    
+    def _fetch_latest_version(self, package_name: str) -> Optional[str]:
+        """Consulta versão mais recente no PyPI (erros de rede são propagados)"""
+        response = self._get_pypi_session().get(f"https://pypi.org/pypi/{package_name}/json", timeout=5)
+        if response.status_code == 200:
+            return response.json()["info"]["version"]
+        return None
     
     def _get_latest_version(self, package_name: str) -> Optional[str]:
         """Obtém versão mais recente do PyPI"""
+        # Cache em memória expira junto com o cache em disco
+        if time.monotonic() - self._latest_version_cache_time > PYPI_CACHE_EXPIRY:
+            self._latest_version_cached.cache_clear()
+            self._latest_version_cache_time = time.monotonic()
         try:
-            response = requests.get(f"https://pypi.org/pypi/{package_name}/json", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return data["info"]["version"]
+            return self._latest_version_cached(package_name)
         except:
-            pass
-        return None
+            return None
     
-    def _is_newer_version(self, latest: str, installed: str) -> bool:
+    def clear_pypi_cache(self):
+        """Descarta versões do PyPI em cache (memória e disco)"""
+        self._latest_version_cached.cache_clear()
+        self._latest_version_cache_time = time.monotonic()
+        self._latest_version_memo.clear()
+        if REQUESTS_CACHE_AVAILABLE:
+            self._get_pypi_session().cache.clear()
+    
+    def _is_newer_version(self, latest: str, installed) -> bool:
         """Verifica se versão mais recente é mais nova"""
+        if installed is None:
+            return False
+        from packaging.version import Version, InvalidVersion
         try:
-            from packaging import version
-            return version.parse(latest) > version.parse(installed)
-        except:
+            return Version(latest) > installed
+        except InvalidVersion:
             return False
     
-    def check_all_dependencies(self, force_check: bool = False) -> List[DependencyInfo]:
-        """Verifica todas as dependências"""
-        results = []
+    def _pypi_due(self) -> set:
+        """Dependências que consultam o PyPI neste ciclo (rotação em PYPI_ROTATION fatias)"""
+        slot = self._pypi_tick % PYPI_ROTATION
+        self._pypi_tick += 1
+        return {dep.name for i, dep in enumerate(self.dependencies) if i % PYPI_ROTATION == slot}
+    
+    def _previous_latest(self, name: str, pypi_due: Optional[set]):
+        """Versão do PyPI da verificação anterior, ou _FETCH_LATEST se a consulta é devida"""
+        previous = self.dependency_cache.get(name)
+        if pypi_due is None or name in pypi_due or previous is None:
+            return _FETCH_LATEST
+        return previous.latest_version
+    
+    def check_all_dependencies(self, force_check: bool = False,
+                               pypi_due: Optional[set] = None) -> List[DependencyInfo]:
+        """Verifica todas as dependências
+        
+        pypi_due limita as consultas ao PyPI a essas dependências; as demais reaproveitam
+        a versão da verificação anterior (None consulta todas).
+        """
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+        
+        results: Dict[str, DependencyInfo] = {}
         
         with Progress(
             SpinnerColumn(),
@@ -396,20 +557,71 @@ class DependencyMonitor:
             total_deps = len(self.dependencies)
             task = progress.add_task("Verificando dependências...", total=total_deps)
             
-            for dep in self.dependencies:
-                progress.update(task, description=f"Verificando {dep['name']}...")
-                
-                result = self.check_dependency(dep["name"], force_check)
-                results.append(result)
-                
+            sweep_ts = datetime.now().isoformat()
+            futures = {
+                self._check_executor.submit(
+                    self.check_dependency, dep.name, force_check,
+                    latest_version=self._previous_latest(dep.name, pypi_due), sweep_ts=sweep_ts
+                ): dep.name
+                for dep in self.dependencies
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                progress.update(task, description=f"Verificado {name}")
                 progress.advance(task)
         
-        return results
+        # Mantém a ordem da lista de dependências
+        return [results[dep.name] for dep in self.dependencies]
+    
+    async def _get_latest_version_async(self, package_name: str) -> Optional[str]:
+        """Obtém versão mais recente do PyPI via aiohttp (sessão do loop de monitoramento)"""
+        hit = self._latest_version_memo.get(package_name)
+        if hit and time.monotonic() - hit[0] < PYPI_CACHE_EXPIRY:
+            return hit[1]
+        try:
+            async with self._http.get(f"https://pypi.org/pypi/{package_name}/json") as response:
+                if response.status == 200:
+                    latest = (await response.json())["info"]["version"]
+                elif response.status == 404:
+                    latest = None
+                else:
+                    return None
+        except Exception:
+            # Falhas de rede não são memorizadas
+            return None
+        self._latest_version_memo[package_name] = (time.monotonic(), latest)
+        return latest
+    
+    async def _check_one_async(self, dep: DependencySpec, force_check: bool = False,
+                               sweep_ts: Optional[str] = None,
+                               pypi_due: Optional[set] = None) -> DependencyInfo:
+        """Verifica uma dependência consultando o PyPI sem bloquear o loop"""
+        name = dep.name
+        if not force_check and time.monotonic() - self._cache_ts.get(name, float("-inf")) < self.cache_expiry:
+            return self.dependency_cache[name]
+        
+        latest_version = None
+        if self.config.get("check_pypi", True) and dep.version != "builtin":
+            latest_version = self._previous_latest(name, pypi_due)
+            if latest_version is _FETCH_LATEST:
+                latest_version = await self._get_latest_version_async(dep.package)
+        return self.check_dependency(name, force_check=True, latest_version=latest_version, sweep_ts=sweep_ts)
+    
+    async def check_all_dependencies_async(self, force_check: bool = False,
+                                           pypi_due: Optional[set] = None) -> List[DependencyInfo]:
+        """Verifica todas as dependências com consultas concorrentes ao PyPI"""
+        sweep_ts = datetime.now().isoformat()
+        return list(await asyncio.gather(
+            *[self._check_one_async(dep, force_check, sweep_ts, pypi_due) for dep in self.dependencies]
+        ))
     
     def get_system_health(self) -> SystemHealth:
         """Retorna saúde geral do sistema"""
-        dependencies = self.check_all_dependencies()
-        
+        return self._summarize_health(self.check_all_dependencies())
+    
+    def _summarize_health(self, dependencies: List[DependencyInfo]) -> SystemHealth:
+        """Resume a saúde do sistema a partir das dependências verificadas"""
         critical_deps = [d for d in dependencies if d.is_critical]
         optional_deps = [d for d in dependencies if not d.is_critical]
         
@@ -481,14 +693,14 @@ class DependencyMonitor:
     
     def _monitoring_loop(self):
         """Loop de monitoramento"""
+        if AIOHTTP_AVAILABLE:
+            asyncio.run(self._monitoring_loop_async())
+            return
+        
         while not self._stop_monitoring.is_set():
             try:
-                # Verifica saúde do sistema
-                health = self.get_system_health()
-                
-                # Notifica se há problemas
-                if self.config.get("notify_on_issues", True) and health.issues_found:
-                    self._notify_issues(health)
+                # Verifica saúde do sistema e notifica só se o estado mudou
+                self._on_sweep(self.check_all_dependencies(pypi_due=self._pypi_due()))
                 
                 # Aguarda próxima verificação
                 interval = self.config.get("check_interval", 300)
@@ -498,15 +710,54 @@ class DependencyMonitor:
                 console.print(f"[red]❌ Erro no monitoramento: {e}[/red]")
                 self._stop_monitoring.wait(60)  # Aguarda 1 minuto em caso de erro
     
-    def _notify_issues(self, health: SystemHealth):
-        """Notifica sobre problemas encontrados"""
-        console.print(f"\n⚠️ [bold yellow]Problemas detectados no sistema:[/bold yellow]")
+    async def _monitoring_loop_async(self):
+        """Loop de monitoramento com consultas concorrentes ao PyPI (aiohttp)"""
+        import aiohttp
         
-        for issue in health.issues_found:
-            console.print(f"   • {issue}")
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as self._http:
+            while not self._stop_monitoring.is_set():
+                try:
+                    # Verifica saúde do sistema e notifica só se o estado mudou
+                    self._on_sweep(await self.check_all_dependencies_async(pypi_due=self._pypi_due()))
+                    
+                    interval = self.config.get("check_interval", 300)
+                except Exception as e:
+                    console.print(f"[red]❌ Erro no monitoramento: {e}[/red]")
+                    interval = 60  # Aguarda 1 minuto em caso de erro
+                
+                # Aguarda próxima verificação sem bloquear o loop
+                await asyncio.to_thread(self._stop_monitoring.wait, interval)
+        self._http = None
+    
+    def _on_sweep(self, dependencies: List[DependencyInfo]):
+        """Notifica problemas e callbacks quando o estado das dependências muda"""
+        state_hash = hash(tuple(
+            (d.name, d.status, d.version_installed, d.latest_version, d.update_available)
+            for d in dependencies
+        ))
+        if state_hash == self._last_state_hash:
+            return
+        self._last_state_hash = state_hash
         
-        for recommendation in health.recommendations:
-            console.print(f"   💡 {recommendation}")
+        health = self._summarize_health(dependencies)
+        
+        # Notifica se há problemas
+        if self.config.get("notify_on_issues", True) and health.issues_found:
+            self._notify_issues(health)
+        
+        for callback in self._status_callbacks:
+            try:
+                callback(health)
+            except Exception as e:
+                console.print(f"[red]❌ Erro no callback de status: {e}[/red]")
+    
+    def _notify_issues(self, health: SystemHealth):
+        """Notifica sobre problemas encontrados"""
+        # Um único print: uma renderização e uma escrita no terminal
+        lines = ["\n⚠️ [bold yellow]Problemas detectados no sistema:[/bold yellow]"]
+        lines += [f"   • {issue}" for issue in health.issues_found]
+        lines += [f"   💡 {recommendation}" for recommendation in health.recommendations]
+        console.print("\n".join(lines))
     
     def add_status_callback(self, callback: callable):
         """Adiciona callback para notificações de status"""
@@ -515,13 +766,18 @@ class DependencyMonitor:
     def install_dependency(self, dep_name: str, version: str = None) -> bool:
         """Instala ou atualiza uma dependência"""
         try:
-            if version:
-                cmd = f"pip install {dep_name}=={version}"
-            else:
-                cmd = f"pip install {dep_name}"
+            # Nome de distribuição no PyPI (ex.: PIL -> Pillow)
+            dep_info = self._dep_index.get(dep_name)
+            package = dep_info.package if dep_info else dep_name
             
+            # pip do mesmo interpretador, sem prompts nem checagem de versão do próprio pip
+            argv = [
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input",
+                f"{package}=={version}" if version else package
+            ]
             result = subprocess.run(
-                cmd.split(),
+                argv,
                 capture_output=True,
                 text=True,
                 timeout=300
@@ -529,8 +785,9 @@ class DependencyMonitor:
             
             if result.returncode == 0:
                 # Limpa cache para forçar nova verificação
-                if dep_name in self.dependency_cache:
-                    del self.dependency_cache[dep_name]
+                with self._cache_lock:
+                    self.dependency_cache.pop(dep_name, None)
+                    self._cache_ts.pop(dep_name, None)
                 
                 console.print(f"✅ {dep_name} instalado com sucesso")
                 return True
@@ -544,6 +801,10 @@ class DependencyMonitor:
     
     def show_dependency_status(self):
         """Mostra status de todas as dependências"""
+        from rich.console import Group
+        from rich.table import Table
+        from rich.text import Text
+        
         dependencies = self.check_all_dependencies()
         
         # Tabela de dependências críticas
@@ -563,14 +824,6 @@ class DependencyMonitor:
         optional_table.add_column("Atualização", style="blue")
         
         for dep in dependencies:
-            status_emoji = {
-                DependencyStatus.OK: "✅",
-                DependencyStatus.MISSING: "❌",
-                DependencyStatus.OUTDATED: "⚠️",
-                DependencyStatus.ERROR: "💥",
-                DependencyStatus.CHECKING: "🔄"
-            }.get(dep.status, "❓")
-            
             update_info = ""
             if dep.update_available and dep.latest_version:
                 update_info = f"→ {dep.latest_version}"
@@ -579,7 +832,7 @@ class DependencyMonitor:
                 dep.name,
                 dep.version_installed or "N/A",
                 dep.version_required,
-                f"{status_emoji} {dep.status.value}",
+                _STATUS_EMOJI.get(dep.status, f"❓ {dep.status.value}"),
                 update_info
             ]
             
@@ -588,31 +841,27 @@ class DependencyMonitor:
             else:
                 optional_table.add_row(*row_data)
         
-        console.print(critical_table)
-        console.print(optional_table)
-        
-        # Mostra saúde geral
-        health = self.get_system_health()
+        # Saúde geral a partir da mesma verificação
+        health = self._summarize_health(dependencies)
         
-        health_color = {
-            "HEALTHY": "green",
-            "WARNING": "yellow", 
-            "CRITICAL": "red"
-        }.get(health.overall_status, "white")
+        health_color = _HEALTH_COLOR.get(health.overall_status, "white")
         
-        console.print(f"\n📊 [bold {health_color}]Status Geral: {health.overall_status}[/bold {health_color}]")
-        console.print(f"   Dependências críticas: {health.critical_deps_ok}/{health.critical_deps_total}")
-        console.print(f"   Dependências opcionais: {health.optional_deps_ok}/{health.optional_deps_total}")
+        lines = [
+            f"\n📊 [bold {health_color}]Status Geral: {health.overall_status}[/bold {health_color}]",
+            f"   Dependências críticas: {health.critical_deps_ok}/{health.critical_deps_total}",
+            f"   Dependências opcionais: {health.optional_deps_ok}/{health.optional_deps_total}",
+        ]
         
         if health.issues_found:
-            console.print(f"\n⚠️ [bold yellow]Problemas encontrados:[/bold yellow]")
-            for issue in health.issues_found:
-                console.print(f"   • {issue}")
+            lines.append(f"\n⚠️ [bold yellow]Problemas encontrados:[/bold yellow]")
+            lines += [f"   • {issue}" for issue in health.issues_found]
         
         if health.recommendations:
-            console.print(f"\n💡 [bold cyan]Recomendações:[/bold cyan]")
-            for rec in health.recommendations:
-                console.print(f"   • {rec}")
+            lines.append(f"\n💡 [bold cyan]Recomendações:[/bold cyan]")
+            lines += [f"   • {rec}" for rec in health.recommendations]
+        
+        # Tabelas e resumo renderizados em um único print
+        console.print(Group(critical_table, optional_table, Text.from_markup("\n".join(lines))))
 
 def main():
     """Função principal para gerenciar dependências"""
@@ -625,11 +874,16 @@ def main():
     parser.add_argument("--health", action="store_true", help="Mostrar saúde do sistema")
     parser.add_argument("--start-monitor", action="store_true", help="Iniciar monitoramento")
     parser.add_argument("--stop-monitor", action="store_true", help="Parar monitoramento")
+    parser.add_argument("--clear-cache", action="store_true", help="Limpar cache de versões do PyPI")
     
     args = parser.parse_args()
     
     monitor = DependencyMonitor()
     
+    if args.clear_cache:
+        monitor.clear_pypi_cache()
+        console.print("🧹 Cache de versões do PyPI limpo")
+    
     if args.check:
         monitor.show_dependency_status()
     elif args.check_one:
@@ -650,6 +904,8 @@ def main():
         monitor.stop_monitoring()
     else:
         # Modo interativo
+        from rich.panel import Panel
+        
         console.print(Panel.fit(
             "[bold blue]🔍 MONITOR DE DEPENDÊNCIAS[/bold blue]\n"
             "[cyan]Sistema de validação e monitoramento em tempo real[/cyan]",
@@ -8,7 +8,7 @@ Este script executa a análise de todas as reuniões de forma simples.
 """
 
 from pathlib import Path
-from analisador_comercial_mestre import AnalisadorComercialMestre
+from analisador_comercial_mestre import AnalisadorComercialMestre, listar_transcricoes
 
 
 def main():
@@ -29,7 +29,7 @@ def main():
             print("📁 Crie a pasta e adicione os arquivos .txt das transcrições.")
             return
         
-        arquivos_txt = list(reunioes_path.glob("*.txt"))
+        arquivos_txt = listar_transcricoes(reunioes_path)
         if not arquivos_txt:
             print("❌ ERRO: Nenhum arquivo .txt encontrado na pasta 'Reunioes em TXT'!")
             print("📄 Adicione os arquivos de transcrição (.txt) na pasta.")
@@ -42,25 +42,28 @@ def main():
         
         # Processar todas as reuniões
         print("🔄 Processando reuniões...")
-        resultados = analisador.processar_todas_reunioes()
+        resultados = analisador.processar_todas_reunioes(arquivos_txt)
         
         if resultados:
-        print(f"\n✅ SUCESSO! {len(resultados)} reuniões analisadas.")
-        print("📁 Resultados salvos em: Analises_Comerciais/")
-            print()
-            
-            # Mostrar resumo dos resultados
-            print("📊 RESUMO DOS RESULTADOS:")
-            print("-" * 30)
+            # Resumo montado em memória e impresso de uma vez
+            linhas = [
+                f"\n✅ SUCESSO! {len(resultados)} reuniões analisadas.",
+                "📁 Resultados salvos em: Analises_Comerciais/",
+                "",
+                "📊 RESUMO DOS RESULTADOS:",
+                "-" * 30,
+            ]
             
             for cliente, analise in resultados.items():
-                score = analise['Score_Prioridade']['Score_Geral']
-                classificacao = analise['Score_Prioridade']['Classificacao']
-                print(f"• {cliente}: {score}/10 ({classificacao})")
+                score_prioridade = analise['Score_Prioridade']
+                linhas.append(f"• {cliente}: {score_prioridade['Score_Geral']}/10 ({score_prioridade['Classificacao']})")
             
-            print()
-            print("📋 Para ver análises detalhadas, acesse a pasta 'Analises_Comerciais'")
-            print("📊 Para overview geral, veja 'overview_geral.csv' e 'overview_geral.json'")
+            linhas += [
+                "",
+                "📋 Para ver análises detalhadas, acesse a pasta 'Analises_Comerciais'",
+                "📊 Para overview geral, veja 'overview_geral.csv' e 'overview_geral.json'",
+            ]
+            print("\n".join(linhas))
             
         else:
             print("❌ Nenhuma reunião foi processada com sucesso.")
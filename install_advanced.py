@@ -10,6 +10,8 @@ import os
 import sys
 import subprocess
 import json
+import shutil
+import importlib.metadata
 from pathlib import Path
 from datetime import datetime
 
@@ -20,6 +22,48 @@ from rich.prompt import Prompt, Confirm
 
 console = Console()
 
+# Não paralelize chamadas ao pip (threads/processos): duas instalações simultâneas
+# podem desinstalar a mesma dependência transitiva e corromper o ambiente. As
+# instalações são serializadas em lotes; o paralelismo fica dentro do instalador.
+
+# uv (se instalado) baixa e instala em paralelo; senão, pip priorizando wheels
+UV_PATH = shutil.which("uv")
+
+# Cache local de downloads e wheels construídas, ao lado do instalador:
+# reinstalações não voltam à rede
+WHEEL_CACHE = Path(__file__).resolve().parent / ".wheel_cache"
+
+# pip mais antigo que isto é atualizado antes das instalações
+PIP_MIN_VERSION = (23, 0)
+
+def _install_command():
+    """Comando base de instalação no interpretador atual"""
+    if UV_PATH:
+        return [UV_PATH, "pip", "install", "--python", sys.executable, "--cache-dir", str(WHEEL_CACHE)]
+    return [sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-input",
+            "--cache-dir", str(WHEEL_CACHE)]
+
+def _pip_is_recent() -> bool:
+    """Indica se o pip instalado já atende PIP_MIN_VERSION"""
+    try:
+        version = importlib.metadata.version("pip")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    parts = tuple(int(p) for p in version.split(".")[:2] if p.isdigit())
+    return parts >= PIP_MIN_VERSION
+
+def _prime_pip():
+    """Atualiza pip e wheel antes das instalações, só se o pip for antigo (falha não é fatal)"""
+    if UV_PATH or _pip_is_recent():
+        return
+    console.print(f"⬆️ Atualizando pip (< {'.'.join(map(str, PIP_MIN_VERSION))})...")
+    subprocess.run([sys.executable, "-m", "pip", "install", "-U", "pip", "wheel"],
+                   capture_output=True)
+
+def _pip_install(deps):
+    """Instala um grupo de dependências numa única chamada ao pip (um só resolver)"""
+    subprocess.run([*_install_command(), *deps], capture_output=True, check=True)
+
 def main():
     """Instalador principal"""
     console.print(Panel.fit(
@@ -49,8 +93,14 @@ def main():
             console=console
         ) as progress:
             
-            # 1. Instala dependências básicas
-            task = progress.add_task("Instalando dependências básicas...", total=100)
+            # 0. Prepara o instalador
+            task = progress.add_task("Preparando instalador...", total=100)
+            WHEEL_CACHE.mkdir(exist_ok=True)
+            _prime_pip()
+            progress.update(task, completed=100, description=f"✅ Instalador: {'uv' if UV_PATH else 'pip'}")
+            
+            # 1-3. Instala dependências básicas, de áudio e de IA
+            task = progress.add_task("Instalando dependências básicas, de áudio e de IA...", total=100)
             
             basic_deps = [
                 "openai>=1.0.0",
@@ -62,43 +112,22 @@ def main():
                 "requests>=2.28.0"
             ]
             
-            for dep in basic_deps:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             capture_output=True, check=True)
-                progress.advance(task, advance=100//len(basic_deps))
-            
-            progress.update(task, description="✅ Dependências básicas instaladas")
-            
-            # 2. Instala dependências de áudio
-            task = progress.add_task("Instalando dependências de áudio...", total=100)
-            
             audio_deps = [
                 "sounddevice>=0.4.0",
                 "soundfile>=0.12.0",
                 "scipy>=1.9.0"
             ]
             
-            for dep in audio_deps:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             capture_output=True, check=True)
-                progress.advance(task, advance=100//len(audio_deps))
-            
-            progress.update(task, description="✅ Dependências de áudio instaladas")
-            
-            # 3. Instala dependências de IA
-            task = progress.add_task("Instalando dependências de IA...", total=100)
-            
             ai_deps = [
                 "sentence-transformers>=2.2.0",
                 "chromadb>=0.4.0"
             ]
             
-            for dep in ai_deps:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             capture_output=True, check=True)
-                progress.advance(task, advance=100//len(ai_deps))
+            # Uma única chamada: o resolver vê todos os grupos juntos
+            _pip_install(basic_deps + audio_deps + ai_deps)
+            progress.update(task, completed=100)
             
-            progress.update(task, description="✅ Dependências de IA instaladas")
+            progress.update(task, description="✅ Dependências básicas, de áudio e de IA instaladas")
             
             # 4. Instala dependências opcionais
             task = progress.add_task("Instalando dependências opcionais...", total=100)
@@ -110,13 +139,17 @@ def main():
                 "plyer>=2.1.0"
             ]
             
-            for dep in optional_deps:
-                try:
-                    subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                                 capture_output=True, check=True)
-                except:
-                    pass  # Opcionais podem falhar
-                progress.advance(task, advance=100//len(optional_deps))
+            try:
+                _pip_install(optional_deps)
+                progress.update(task, completed=100)
+            except subprocess.CalledProcessError:
+                # Uma opcional falhou: instala uma a uma para aproveitar as demais
+                for dep in optional_deps:
+                    try:
+                        _pip_install([dep])
+                    except:
+                        pass  # Opcionais podem falhar
+                    progress.advance(task, advance=100//len(optional_deps))
             
             progress.update(task, description="✅ Dependências opcionais instaladas")
             
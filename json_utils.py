@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧾 SALES AGENT IA - UTILITÁRIOS JSON
+===================================
+Serialização JSON compartilhada pelos arquivos de configuração e metadados
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+
+# orjson (opcional) - parse/serialização JSON mais rápidos
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_default(obj):
+    """Converte dataclasses no json padrão, como o orjson faz nativamente"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(data) -> bytes:
+    """Serializa em JSON indentado (UTF-8), via orjson quando disponível"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+def loads_json(raw: bytes):
+    """Desserializa JSON, via orjson quando disponível"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -5,11 +5,15 @@ Converte o AE_SENIOR_TOOLKIT em base de conhecimento inteligente
 """
 
 import os
+import re
+import sys
 import json
 import pickle
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Iterable
+from dataclasses import dataclass, field
 
 import chromadb
 from sentence_transformers import SentenceTransformer
@@ -22,7 +26,22 @@ from config import Config
 
 console = Console()
 
-@dataclass
+ENCODE_BATCH_SIZE = 64   # Textos por forward pass do modelo
+CHROMA_BATCH_SIZE = 500  # Chunks por inserção no ChromaDB
+READ_BUFFER_SIZE = 256 * 1024  # Leitura em blocos grandes, linha a linha
+PARALLEL_MIN_FILES = 32  # Abaixo disso, iniciar processos custa mais que extrair em série
+
+# Embeddings normalizados: produto interno == cosseno (similaridade = 1 - distância)
+COLLECTION_NAME = "sales_knowledge"
+COLLECTION_METADATA = {
+    "description": "AE Senior Toolkit Knowledge Base",
+    "hnsw:space": "ip"
+}
+
+# __slots__ nas dataclasses (dataclass(slots=True) requer Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class KnowledgeChunk:
     """Representa um pedaço de conhecimento"""
     content: str
@@ -31,9 +50,96 @@ class KnowledgeChunk:
     keywords: List[str]
     importance: int  # 1-10
 
+@dataclass
+class ChunkStore:
+    """Chunks em colunas (uma lista por atributo) para extração e construção em lote"""
+    contents: List[str] = field(default_factory=list)
+    source_files: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    keywords: List[List[str]] = field(default_factory=list)
+    importances: List[int] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.contents)
+    
+    def __getitem__(self, index: int) -> KnowledgeChunk:
+        return KnowledgeChunk(
+            content=self.contents[index],
+            source_file=self.source_files[index],
+            category=self.categories[index],
+            keywords=self.keywords[index],
+            importance=self.importances[index]
+        )
+    
+    def append(self, content: str, source_file: str, category: str, keywords: List[str], importance: int):
+        self.contents.append(content)
+        self.source_files.append(source_file)
+        self.categories.append(category)
+        self.keywords.append(keywords)
+        self.importances.append(importance)
+    
+    def extend(self, other: "ChunkStore"):
+        self.contents.extend(other.contents)
+        self.source_files.extend(other.source_files)
+        self.categories.extend(other.categories)
+        self.keywords.extend(other.keywords)
+        self.importances.extend(other.importances)
+
+def _hash_file(file_path: Path) -> str:
+    """Hash do conteúdo do arquivo (detecta arquivos alterados entre construções)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _extract_chunks_from_file(file_path: Path) -> ChunkStore:
+    """Extrai os chunks de um arquivo em um processo do pool"""
+    return SalesKnowledgeEmbedder.extract_chunks_from_file(file_path)
+
 class SalesKnowledgeEmbedder:
     """Sistema de embeddings para base de conhecimento de vendas"""
     
+    # Diretório do toolkit -> categoria
+    _CATEGORY_MAP = {
+        "01_PROSPECCAO_AVANCADA": "prospecting",
+        "02_QUALIFICACAO_LEADS": "qualification", 
+        "03_DISCOVERY_COMPLETO": "discovery",
+        "04_DEMO_PERSONALIZADA": "demo",
+        "05_PROPOSTA_COMERCIAL": "proposal",
+        "06_NEGOCIACAO_FECHAMENTO": "closing",
+        "07_ANALISE_COMPETITIVA": "competitive",
+        "08_ROI_BUSINESS_CASE": "roi",
+        "09_PLAYBOOKS_VERTICAIS": "industry",
+        "10_CRM_AUTOMACAO": "automation",
+        "11_FOLLOW_UP_SEQUENCES": "follow_up",
+        "12_OBJECTION_HANDLING": "objections",
+        "13_RECURSOS_EXECUTIVOS": "executive",
+        "14_POS_VENDA_EXPANSION": "expansion"
+    }
+    
+    # Palavras-chave específicas de vendas (ordem define prioridade)
+    SALES_KEYWORDS = [
+        'objeção', 'fechamento', 'prospect', 'lead', 'discovery', 'demo',
+        'proposta', 'negociação', 'roi', 'valor', 'benefício', 'dor',
+        'necessidade', 'orçamento', 'autoridade', 'decisor', 'urgência',
+        'competição', 'diferencial', 'case', 'referência', 'follow-up'
+    ]
+    
+    # Palavras-chave de alta importância
+    HIGH_VALUE_WORDS = ['fechamento', 'objeção', 'decisor', 'orçamento', 'roi']
+    
+    # Uma única passada acha todas as palavras (lookahead: inclui sobreposições, como `in`)
+    _KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, dict.fromkeys(SALES_KEYWORDS + HIGH_VALUE_WORDS))) + "))"
+    )
+    
+    # Divisores comuns no toolkit
+    _DIV_RE = re.compile("|".join(map(re.escape, ['===', '---', '###', '##', '🎯', '💡', '⚡', '🔥'])))
+    
+    # Marcadores de estrutura (listas, frameworks)
+    _LIST_RE = re.compile("|".join(map(re.escape, ['1.', '2.', '•', '-', '✓'])))
+    
     def __init__(self):
         Config.create_directories()
         
@@ -43,120 +149,105 @@ class SalesKnowledgeEmbedder:
         # Inicializa ChromaDB
         self.client = chromadb.PersistentClient(path=str(Config.EMBEDDINGS_DIR))
         self.collection = self.client.get_or_create_collection(
-            name="sales_knowledge",
-            metadata={"description": "AE Senior Toolkit Knowledge Base"}
+            name=COLLECTION_NAME,
+            metadata=COLLECTION_METADATA
         )
         
         logger.info("✅ Sistema de embeddings inicializado")
     
-    def extract_chunks_from_file(self, file_path: Path) -> List[KnowledgeChunk]:
+    @classmethod
+    def extract_chunks_from_file(cls, file_path: Path) -> ChunkStore:
         """Extrai chunks relevantes de um arquivo do toolkit"""
-        chunks = []
+        chunks = ChunkStore()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Determina categoria baseada no diretório
-            category = self._get_category_from_path(file_path)
+            category = cls._get_category_from_path(file_path)
+            rel_path = str(file_path.relative_to(Config.BASE_DIR))
             
-            # Divide em seções lógicas
-            sections = self._split_into_sections(content)
+            # Divide em seções lógicas numa única passada pelo arquivo
+            with open(file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+                sections = cls._split_into_sections(f)
             
             for section in sections:
                 if len(section.strip()) > 50:  # Ignora seções muito pequenas
-                    chunk = KnowledgeChunk(
+                    section_lower = section.lower()
+                    chunks.append(
                         content=section.strip(),
-                        source_file=str(file_path.relative_to(Config.BASE_DIR)),
+                        source_file=rel_path,
                         category=category,
-                        keywords=self._extract_keywords(section),
-                        importance=self._calculate_importance(section, category)
+                        keywords=cls._extract_keywords(section, section_lower),
+                        importance=cls._calculate_importance(section, section_lower, category)
                     )
-                    chunks.append(chunk)
                     
         except Exception as e:
             logger.error(f"❌ Erro ao processar {file_path}: {e}")
             
         return chunks
     
-    def _get_category_from_path(self, file_path: Path) -> str:
+    @classmethod
+    def _get_category_from_path(cls, file_path: Path) -> str:
         """Determina categoria baseada no caminho do arquivo"""
-        path_parts = file_path.parts
-        
-        category_map = {
-            "01_PROSPECCAO_AVANCADA": "prospecting",
-            "02_QUALIFICACAO_LEADS": "qualification", 
-            "03_DISCOVERY_COMPLETO": "discovery",
-            "04_DEMO_PERSONALIZADA": "demo",
-            "05_PROPOSTA_COMERCIAL": "proposal",
-            "06_NEGOCIACAO_FECHAMENTO": "closing",
-            "07_ANALISE_COMPETITIVA": "competitive",
-            "08_ROI_BUSINESS_CASE": "roi",
-            "09_PLAYBOOKS_VERTICAIS": "industry",
-            "10_CRM_AUTOMACAO": "automation",
-            "11_FOLLOW_UP_SEQUENCES": "follow_up",
-            "12_OBJECTION_HANDLING": "objections",
-            "13_RECURSOS_EXECUTIVOS": "executive",
-            "14_POS_VENDA_EXPANSION": "expansion"
-        }
-        
-        for part in path_parts:
-            if part in category_map:
-                return category_map[part]
-                
-        return "general"
+        return next((cls._CATEGORY_MAP[part] for part in file_path.parts if part in cls._CATEGORY_MAP), "general")
     
-    def _split_into_sections(self, content: str) -> List[str]:
-        """Divide conteúdo em seções lógicas"""
+    @classmethod
+    def _split_into_sections(cls, lines: Iterable[str]) -> List[str]:
+        """Divide conteúdo (linhas, ex.: arquivo aberto) em seções lógicas"""
         sections = []
+        current_section = []
         
-        # Divisores comuns no toolkit
-        dividers = ['===', '---', '###', '##', '🎯', '💡', '⚡', '🔥']
-        
-        current_section = ""
-        lines = content.split('\n')
+        # Parágrafos (separados por linha vazia) para o caso sem divisores;
+        # deixam de ser coletados quando já há duas seções
+        paragraphs = []
+        current_paragraph = []
         
         for line in lines:
+            line = line.rstrip('\n')
+            
             # Verifica se é uma nova seção
-            is_new_section = any(div in line for div in dividers)
+            is_new_section = cls._DIV_RE.search(line) is not None
+            
+            if is_new_section:
+                section = "\n".join(current_section).strip()
+                if len(section) > 100:
+                    sections.append(section)
+                    current_section = []
+            current_section.append(line)
             
-            if is_new_section and len(current_section.strip()) > 100:
-                sections.append(current_section.strip())
-                current_section = line + '\n'
-            else:
-                current_section += line + '\n'
+            if len(sections) < 2:
+                if line:
+                    current_paragraph.append(line)
+                elif current_paragraph:
+                    paragraphs.append("\n".join(current_paragraph).strip())
+                    current_paragraph = []
         
         # Adiciona última seção
-        if len(current_section.strip()) > 100:
-            sections.append(current_section.strip())
+        section = "\n".join(current_section).strip()
+        if len(section) > 100:
+            sections.append(section)
             
         # Se não encontrou divisores, divide por paragrafos
         if len(sections) < 2:
-            paragraphs = content.split('\n\n')
-            sections = [p.strip() for p in paragraphs if len(p.strip()) > 100]
+            paragraphs.append("\n".join(current_paragraph).strip())
+            sections = [p for p in paragraphs if len(p) > 100]
             
         return sections
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extrai palavras-chave importantes do texto"""
-        # Palavras-chave específicas de vendas
-        sales_keywords = [
-            'objeção', 'fechamento', 'prospect', 'lead', 'discovery', 'demo',
-            'proposta', 'negociação', 'roi', 'valor', 'benefício', 'dor',
-            'necessidade', 'orçamento', 'autoridade', 'decisor', 'urgência',
-            'competição', 'diferencial', 'case', 'referência', 'follow-up'
-        ]
-        
-        found_keywords = []
-        text_lower = text.lower()
+    @classmethod
+    def _find_keywords(cls, text_lower: str) -> set:
+        """Palavras-chave (vendas e alto valor) presentes no texto já em minúsculas"""
+        return set(cls._KEYWORD_RE.findall(text_lower))
+    
+    @classmethod
+    def _extract_keywords(cls, text: str, text_lower: str) -> List[str]:
+        """Extrai palavras-chave importantes do texto (text_lower: text.lower() já calculado)"""
+        found = cls._find_keywords(text_lower)
+        found_keywords = [keyword for keyword in cls.SALES_KEYWORDS if keyword in found]
         
-        for keyword in sales_keywords:
-            if keyword in text_lower:
-                found_keywords.append(keyword)
-                
         return found_keywords[:5]  # Máximo 5 keywords
     
-    def _calculate_importance(self, text: str, category: str) -> int:
+    @classmethod
+    def _calculate_importance(cls, text: str, text_lower: str, category: str) -> int:
         """Calcula importância do chunk (1-10)"""
         importance = 5  # Base
         
@@ -166,13 +257,11 @@ class SalesKnowledgeEmbedder:
             importance += 2
             
         # Aumenta por palavras-chave de alta importância
-        high_value_words = ['fechamento', 'objeção', 'decisor', 'orçamento', 'roi']
-        for word in high_value_words:
-            if word in text.lower():
-                importance += 1
+        found = cls._find_keywords(text_lower)
+        importance += sum(1 for word in cls.HIGH_VALUE_WORDS if word in found)
                 
         # Aumenta por estrutura (listas, frameworks)
-        if any(char in text for char in ['1.', '2.', '•', '-', '✓']):
+        if cls._LIST_RE.search(text):
             importance += 1
             
         return min(importance, 10)
@@ -181,77 +270,153 @@ class SalesKnowledgeEmbedder:
         """Constrói base de conhecimento completa"""
         console.print("🧠 [bold blue]Construindo base de conhecimento...[/bold blue]")
         
-        all_chunks = []
+        all_chunks = ChunkStore()
         processed_files = 0
         
         # Processa todos os arquivos .txt do toolkit
-        for txt_file in track(
-            list(Config.TOOLKIT_DIR.rglob("*.txt")), 
-            description="Processando arquivos..."
-        ):
-            chunks = self.extract_chunks_from_file(txt_file)
-            all_chunks.extend(chunks)
-            processed_files += 1
+        txt_files = list(Config.TOOLKIT_DIR.rglob("*.txt"))
         
-        console.print(f"📄 Processados: {processed_files} arquivos")
+        # Arquivos sem alteração desde a última construção ficam como estão no ChromaDB
+        file_hashes = {str(f.relative_to(Config.BASE_DIR)): _hash_file(f) for f in txt_files}
+        # Manifesto sem chunks correspondentes (collection vazia) não vale
+        previous_hashes = self._load_manifest() if self.collection.count() else {}
+        unchanged = {source for source, digest in file_hashes.items() if previous_hashes.get(source) == digest}
+        stale = set(previous_hashes) - unchanged  # Alterados ou removidos
+        stored_metadata = self._load_stored_metadata(unchanged)
+        txt_files = [f for f in txt_files if str(f.relative_to(Config.BASE_DIR)) not in unchanged]
+        
+        if len(txt_files) >= PARALLEL_MIN_FILES:
+            # Extração é CPU (strings/regex): arquivos independentes rodam em paralelo entre processos
+            max_workers = min(os.cpu_count() or 1, len(txt_files))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for chunks in track(
+                    executor.map(_extract_chunks_from_file, txt_files, chunksize=8),
+                    total=len(txt_files),
+                    description="Processando arquivos..."
+                ):
+                    all_chunks.extend(chunks)
+                    processed_files += 1
+        else:
+            for txt_file in track(txt_files, description="Processando arquivos..."):
+                chunks = self.extract_chunks_from_file(txt_file)
+                all_chunks.extend(chunks)
+                processed_files += 1
+        
+        console.print(f"📄 Processados: {processed_files} arquivos ({len(unchanged)} sem alteração)")
         console.print(f"🧩 Chunks extraídos: {len(all_chunks)}")
         
         # Cria embeddings
         console.print("🔄 [bold yellow]Gerando embeddings...[/bold yellow]")
         
-        # Limpa collection anterior
-        self.collection.delete()
-        self.collection = self.client.get_or_create_collection(
-            name="sales_knowledge",
-            metadata={"description": "AE Senior Toolkit Knowledge Base"}
-        )
+        # Embeddings em lote pelo próprio modelo (normalizados, como na busca)
+        # (só para chunks novos ou alterados)
+        if all_chunks:
+            embeddings = self.model.encode(
+                all_chunks.contents,
+                batch_size=ENCODE_BATCH_SIZE,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+        processed_files += len(unchanged)
+        
+        # Manifesto só volta a valer quando a collection estiver completa
+        manifest_path = Config.EMBEDDINGS_DIR / "manifest.json"
+        manifest_path.unlink(missing_ok=True)
+        
+        if not previous_hashes:
+            # Sem manifesto válido: recria a collection (o espaço de distância só é definido na criação)
+            self.client.delete_collection(COLLECTION_NAME)
+            self.collection = self.client.get_or_create_collection(
+                name=COLLECTION_NAME,
+                metadata=COLLECTION_METADATA
+            )
+        else:
+            # Remove apenas os chunks de arquivos alterados ou removidos
+            for source in stale:
+                self.collection.delete(where={"source_file": source})
+        
+        # Posição do próximo chunk de cada arquivo (IDs estáveis: "<arquivo>#<posição>")
+        positions: Dict[str, int] = {}
         
         # Processa em batches
-        batch_size = 100
+        batch_size = CHROMA_BATCH_SIZE
         for i in track(range(0, len(all_chunks), batch_size), description="Embedding..."):
-            batch = all_chunks[i:i+batch_size]
-            
-            # Prepara dados para ChromaDB
-            documents = [chunk.content for chunk in batch]
-            metadatas = [
-                {
-                    "source_file": chunk.source_file,
-                    "category": chunk.category,
-                    "keywords": ",".join(chunk.keywords),
-                    "importance": chunk.importance
-                }
-                for chunk in batch
-            ]
-            ids = [f"chunk_{i+j}" for j in range(len(batch))]
+            # Prepara dados para ChromaDB direto das colunas
+            documents = all_chunks.contents[i:i+batch_size]
+            metadatas = []
+            ids = []
+            for source_file, category, keywords, importance in zip(
+                all_chunks.source_files[i:i+batch_size],
+                all_chunks.categories[i:i+batch_size],
+                all_chunks.keywords[i:i+batch_size],
+                all_chunks.importances[i:i+batch_size]
+            ):
+                position = positions.get(source_file, 0)
+                positions[source_file] = position + 1
+                
+                metadatas.append({
+                    "source_file": source_file,
+                    "category": category,
+                    "keywords": ",".join(keywords),
+                    "importance": importance
+                })
+                ids.append(f"{source_file}#{position}")
             
             # Adiciona ao ChromaDB
-            self.collection.add(
+            self.collection.upsert(
+                embeddings=embeddings[i:i+batch_size].tolist(),
                 documents=documents,
                 metadatas=metadatas,
                 ids=ids
             )
         
-        # Salva estatísticas
+        # Salva estatísticas (chunks novos + os que ficaram no ChromaDB)
+        importances = all_chunks.importances + [m["importance"] for m in stored_metadata]
+        categories = set(all_chunks.categories) | {m["category"] for m in stored_metadata}
         stats = {
-            "total_chunks": len(all_chunks),
+            "total_chunks": len(importances),
             "files_processed": processed_files,
-            "categories": list(set(chunk.category for chunk in all_chunks)),
-            "avg_importance": sum(chunk.importance for chunk in all_chunks) / len(all_chunks)
+            "categories": list(categories),
+            "avg_importance": sum(importances) / len(importances)
         }
         
         with open(Config.EMBEDDINGS_DIR / "stats.json", 'w') as f:
             json.dump(stats, f, indent=2)
+        
+        with open(manifest_path, 'w') as f:
+            json.dump({"model": Config.EMBEDDING_MODEL, "files": file_hashes}, f, indent=2)
             
         console.print(f"✅ [bold green]Base de conhecimento construída![/bold green]")
         console.print(f"📊 Estatísticas salvas em: {Config.EMBEDDINGS_DIR / 'stats.json'}")
         
         return stats
     
+    def _load_manifest(self) -> Dict[str, str]:
+        """Hashes dos arquivos da última construção (vazio se o modelo mudou ou não há manifesto)"""
+        try:
+            with open(Config.EMBEDDINGS_DIR / "manifest.json", 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("model") != Config.EMBEDDING_MODEL:
+            return {}
+        return manifest.get("files", {})
+    
+    def _load_stored_metadata(self, sources: set) -> List[Dict]:
+        """Metadados dos chunks já armazenados no ChromaDB para os arquivos informados"""
+        if not sources:
+            return []
+        stored = self.collection.get(include=["metadatas"])
+        return [metadata for metadata in stored["metadatas"] if metadata["source_file"] in sources]
+    
     def search_knowledge(self, query: str, top_k: int = 3) -> List[Dict]:
         """Busca conhecimento relevante para uma query"""
         try:
+            # Query no mesmo espaço de embeddings usado na construção
+            query_embedding = self.model.encode(query, convert_to_numpy=True, normalize_embeddings=True)
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[query_embedding.tolist()],
                 n_results=top_k,
                 include=["documents", "metadatas", "distances"]
             )
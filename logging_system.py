@@ -7,6 +7,7 @@ Sistema avançado de logging com categorização, análise e monitoramento
 """
 
 import os
+import copy
 import json
 import time
 import threading
@@ -26,6 +27,8 @@ from rich.progress import Progress
 from rich.text import Text
 from rich import box
 
+from config import DEFAULT_LOGGING_CONFIG
+
 console = Console()
 
 class LogLevel(Enum):
@@ -117,32 +120,7 @@ class StructuredLogger:
         """Carrega configuração de logging"""
         config_file = self.logs_dir / "logging_config.json"
         
-        default_config = {
-            "level": "INFO",
-            "max_file_size": "10MB",
-            "retention_days": 30,
-            "enable_console": True,
-            "enable_file": True,
-            "enable_analysis": True,
-            "enable_performance_logging": True,
-            "categories": {
-                "SYSTEM": {"level": "INFO", "enabled": True},
-                "AUDIO": {"level": "DEBUG", "enabled": True},
-                "SPEECH": {"level": "INFO", "enabled": True},
-                "AI": {"level": "DEBUG", "enabled": True},
-                "UI": {"level": "INFO", "enabled": True},
-                "BACKUP": {"level": "INFO", "enabled": True},
-                "CONFIG": {"level": "DEBUG", "enabled": True},
-                "ERROR": {"level": "ERROR", "enabled": True},
-                "PERFORMANCE": {"level": "INFO", "enabled": True},
-                "USER": {"level": "INFO", "enabled": True}
-            },
-            "formats": {
-                "console": "{time:HH:mm:ss} | {level: <8} | {category: <12} | {message}",
-                "file": "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {category: <12} | {module}:{function}:{line} | {message}",
-                "json": "{time:YYYY-MM-DD HH:mm:ss} | {level} | {category} | {module}:{function}:{line} | {message} | {extra_data}"
-            }
-        }
+        default_config = copy.deepcopy(DEFAULT_LOGGING_CONFIG)
         
         if config_file.exists():
             try:
@@ -0,0 +1,87 @@
+"""
+🧪 SALES AGENT IA - TESTE DO IO_URING NOS BACKUPS
+================================================
+Hash e cópia via io_uring (arquivos > 1 MiB) e fallback quando o ring falha
+"""
+
+import os
+
+import pytest
+
+import backup_manager as bm
+
+# Tamanho fora do alinhamento de bloco: cobre o último bloco parcial
+FILE_SIZE = 3 * bm.URING_BLOCK_SIZE + 12345
+
+def _drain_pool():
+    while True:
+        try:
+            bm._URING_POOL.get_nowait().close()
+        except bm.queue.Empty:
+            return
+
+@pytest.fixture(autouse=True)
+def uring_enabled():
+    """Cada teste começa com o io_uring habilitado e sem rings no pool"""
+    _drain_pool()
+    bm._URING_DISABLED.clear()
+    yield
+    _drain_pool()
+    bm._URING_DISABLED.clear()
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "origem.bin"
+    path.write_bytes(os.urandom(FILE_SIZE))
+    return path
+
+def _buffered_digest(path) -> bytes:
+    hasher = bm._new_hasher()
+    hasher.update(path.read_bytes())
+    return hasher.digest()
+
+@pytest.fixture
+def real_uring():
+    """Pula se liburing não está instalado ou se o io_uring está bloqueado (ex.: seccomp)"""
+    pytest.importorskip("liburing")
+    if not bm.LIBURING_AVAILABLE:
+        pytest.skip("io_uring disponível apenas no Linux")
+    try:
+        bm.UringIO(depth=2).close()
+    except Exception as e:
+        pytest.skip(f"io_uring indisponível: {e!r}")
+
+def test_uring_hash_round_trip(real_uring, big_file):
+    assert bm._uring_hash(big_file, FILE_SIZE) == _buffered_digest(big_file)
+    assert not bm._URING_DISABLED.is_set()
+
+def test_uring_copy_round_trip(real_uring, big_file, tmp_path):
+    target = tmp_path / "destino.bin"
+    in_fd = os.open(big_file, os.O_RDONLY)
+    out_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        assert bm._uring_copy(in_fd, out_fd)
+    finally:
+        os.close(in_fd)
+        os.close(out_fd)
+    assert target.read_bytes() == big_file.read_bytes()
+    assert not bm._URING_DISABLED.is_set()
+
+def test_uring_failure_falls_back_and_disables(monkeypatch, big_file, tmp_path):
+    def broken_uring(*args, **kwargs):
+        raise AttributeError("binding incompatível")
+
+    monkeypatch.setattr(bm, "LIBURING_AVAILABLE", True)
+    monkeypatch.setattr(bm, "UringIO", broken_uring)
+
+    assert bm.BackupManager._hash_file(big_file) == _buffered_digest(big_file)
+    assert bm._URING_DISABLED.is_set()
+
+    target = tmp_path / "destino.bin"
+    in_fd = os.open(big_file, os.O_RDONLY)
+    out_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        assert not bm._uring_copy(in_fd, out_fd)
+    finally:
+        os.close(in_fd)
+        os.close(out_fd)